@@ -0,0 +1,178 @@
+"""
+Density-adaptive graph facade.
+
+Wraps the two concrete representations and picks between them at
+runtime: the graph starts life as an adjacency list (cheap for sparse
+graphs) and migrates itself to an adjacency matrix once it becomes
+dense enough that O(1) edge checks and compact row storage pay for the
+one-time conversion.
+"""
+
+from graph_adjacency_list import GraphAdjacencyList
+from graph_adjacency_matrix import GraphAdjacencyMatrix
+
+
+def best_representation(num_vertices, num_edges, directed=False, weighted=False):
+    """
+    Pick the graph representation suited to an expected size.
+
+    Applies the facade's density heuristic up front: when the expected
+    edge count makes the graph dense, return an (empty) adjacency
+    matrix, otherwise an adjacency list. Callers that know their size
+    in advance build one structure instead of populating both and
+    discarding one.
+
+    Args:
+        num_vertices: Expected number of vertices
+        num_edges: Expected number of edges
+        directed (bool): Whether the graph is directed
+        weighted (bool): Whether the graph is weighted
+
+    Returns:
+        An empty GraphAdjacencyMatrix or GraphAdjacencyList
+    """
+    max_edges = num_vertices * (num_vertices - 1)
+    if not directed:
+        max_edges //= 2
+    density = num_edges / max_edges if max_edges > 0 else 0
+
+    if density > Graph.DENSITY_THRESHOLD:
+        return GraphAdjacencyMatrix(directed=directed, weighted=weighted)
+    return GraphAdjacencyList(directed=directed, weighted=weighted)
+
+
+class Graph:
+    """
+    Graph facade that auto-selects its internal representation.
+
+    Starts with an adjacency list and converts to an adjacency matrix
+    when the edge count exceeds DENSITY_THRESHOLD * V^2 (and the graph
+    is large enough for the difference to matter). All operations
+    delegate to whichever backend is currently active, so callers use
+    the same API as the concrete classes.
+    """
+
+    # Migrate to a matrix once |E| > 0.25 * V^2; below ~32 vertices the
+    # representations are indistinguishable, so don't bother converting
+    DENSITY_THRESHOLD = 0.25
+    MIN_VERTICES_FOR_MATRIX = 32
+
+    def __init__(self, directed=False, weighted=False):
+        """
+        Initialize the graph.
+
+        Args:
+            directed (bool): Whether the graph is directed
+            weighted (bool): Whether the graph is weighted
+        """
+        self.directed = directed
+        self.weighted = weighted
+        self._impl = GraphAdjacencyList(directed=directed, weighted=weighted)
+
+    def _maybe_densify(self):
+        """
+        Convert the adjacency list to a matrix if the graph has become
+        dense. One-time O(V^2 + E) cost for permanently O(1) edge checks.
+        """
+        if not isinstance(self._impl, GraphAdjacencyList):
+            return
+
+        num_vertices = self._impl.get_vertex_count()
+        if num_vertices <= self.MIN_VERTICES_FOR_MATRIX:
+            return
+
+        if self._impl.get_edge_count() <= self.DENSITY_THRESHOLD * num_vertices * num_vertices:
+            return
+
+        matrix = GraphAdjacencyMatrix(directed=self.directed, weighted=self.weighted)
+        for vertex in self._impl.get_vertices():
+            matrix.add_vertex(vertex)
+        for vertex in self._impl.get_vertices():
+            for neighbor, weight in self._impl.iter_neighbors(vertex):
+                matrix.add_edge(vertex, neighbor, weight)
+        self._impl = matrix
+
+    def add_vertex(self, vertex):
+        """Add a vertex to the graph (see the concrete classes)."""
+        return self._impl.add_vertex(vertex)
+
+    def add_vertices(self, vertices):
+        """Add many vertices in one call (see the concrete classes)."""
+        return self._impl.add_vertices(vertices)
+
+    def add_edge(self, from_vertex, to_vertex, weight=1):
+        """Add an edge, migrating to a matrix if the graph turned dense."""
+        added = self._impl.add_edge(from_vertex, to_vertex, weight)
+        if added:
+            self._maybe_densify()
+        return added
+
+    def add_edges(self, edges):
+        """Add many edges in one call, then re-check density once."""
+        added = self._impl.add_edges(edges)
+        if added:
+            self._maybe_densify()
+        return added
+
+    def remove_edge(self, from_vertex, to_vertex):
+        """Remove an edge between two vertices."""
+        return self._impl.remove_edge(from_vertex, to_vertex)
+
+    def has_vertex(self, vertex):
+        """Check if a vertex exists in the graph."""
+        return self._impl.has_vertex(vertex)
+
+    def has_edge(self, from_vertex, to_vertex):
+        """Check if an edge exists between two vertices."""
+        return self._impl.has_edge(from_vertex, to_vertex)
+
+    def get_edge_weight(self, from_vertex, to_vertex):
+        """Get the weight of an edge, or None if it doesn't exist."""
+        return self._impl.get_edge_weight(from_vertex, to_vertex)
+
+    def get_degree(self, vertex):
+        """Get the number of neighbors of a vertex."""
+        return self._impl.get_degree(vertex)
+
+    def get_neighbors(self, vertex):
+        """Get all neighbors of a vertex as (neighbor, weight) tuples."""
+        return self._impl.get_neighbors(vertex)
+
+    def iter_neighbors(self, vertex):
+        """Iterate over the neighbors of a vertex without building a list."""
+        return self._impl.iter_neighbors(vertex)
+
+    def get_neighbors_arrays(self, vertex):
+        """Get the neighbors of a vertex as parallel (labels, weights) tuples."""
+        return self._impl.get_neighbors_arrays(vertex)
+
+    def get_vertices(self):
+        """Get all vertices in the graph."""
+        return self._impl.get_vertices()
+
+    def get_vertex_count(self):
+        """Get the number of vertices in the graph."""
+        return self._impl.get_vertex_count()
+
+    def get_edge_count(self):
+        """Get the number of edges in the graph."""
+        return self._impl.get_edge_count()
+
+    @property
+    def _version(self):
+        """Mutation counter of the active backend (used by caches)."""
+        return self._impl._version
+
+    def to_csr(self):
+        """Build a Compressed-Sparse-Row snapshot of the graph."""
+        return self._impl.to_csr()
+
+    def display(self):
+        """Display the currently active representation of the graph."""
+        self._impl.display()
+
+    def __str__(self):
+        """String representation of the graph."""
+        backend = type(self._impl).__name__
+        return (f"Graph(backend={backend}, vertices={self.get_vertex_count()}, "
+                f"edges={self.get_edge_count()})")
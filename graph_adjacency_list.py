@@ -1,9 +1,12 @@
 """
 Graph implementation using Adjacency List representation.
-This representation uses a dictionary where each vertex maps to a list
-of its adjacent vertices and edge weights.
+This representation uses a dictionary where each vertex maps to a
+dictionary of its adjacent vertices and edge weights.
 """
 
+import sys
+from array import array
+
 
 class GraphAdjacencyList:
     """
@@ -13,9 +16,9 @@ class GraphAdjacencyList:
     Time Complexity:
     - Add vertex: O(1)
     - Add edge: O(1)
-    - Remove edge: O(E) where E is edges from vertex
-    - Check edge: O(E) where E is edges from vertex
-    - Get neighbors: O(1)
+    - Remove edge: O(1)
+    - Check edge: O(1)
+    - Get neighbors: O(degree)
 
     Space Complexity: O(V + E)
     """
@@ -30,7 +33,9 @@ class GraphAdjacencyList:
         """
         self.directed = directed
         self.weighted = weighted
-        self.adjacency_list = {}  # Maps vertex -> list of (neighbor, weight) tuples
+        self.adjacency_list = {}  # Maps vertex -> {neighbor: weight}
+        self._edge_count = 0  # Maintained incrementally by add_edge/remove_edge
+        self._version = 0  # Bumped on every mutation; lets caches detect staleness
 
     def add_vertex(self, vertex):
         """
@@ -45,9 +50,33 @@ class GraphAdjacencyList:
         if vertex in self.adjacency_list:
             return False
 
-        self.adjacency_list[vertex] = []
+        self.adjacency_list[vertex] = {}
+        self._version += 1
         return True
 
+    def add_vertices(self, vertices):
+        """
+        Add many vertices in a single call.
+
+        Skips labels that already exist and bumps the version once for
+        the whole batch instead of per vertex.
+
+        Args:
+            vertices: Iterable of vertex labels
+
+        Returns:
+            int: Number of vertices actually added
+        """
+        adj = self.adjacency_list
+        added = 0
+        for vertex in vertices:
+            if vertex not in adj:
+                adj[vertex] = {}
+                added += 1
+        if added:
+            self._version += 1
+        return added
+
     def add_edge(self, from_vertex, to_vertex, weight=1):
         """
         Add an edge between two vertices.
@@ -63,25 +92,57 @@ class GraphAdjacencyList:
         if from_vertex not in self.adjacency_list or to_vertex not in self.adjacency_list:
             return False
 
-        # Check if edge already exists, update weight if it does
-        for i, (neighbor, _) in enumerate(self.adjacency_list[from_vertex]):
-            if neighbor == to_vertex:
-                self.adjacency_list[from_vertex][i] = (to_vertex, weight)
-                if not self.directed:
-                    for j, (neighbor2, _) in enumerate(self.adjacency_list[to_vertex]):
-                        if neighbor2 == from_vertex:
-                            self.adjacency_list[to_vertex][j] = (from_vertex, weight)
-                return True
-
-        # Add new edge
-        self.adjacency_list[from_vertex].append((to_vertex, weight))
+        # Add or update edge with a single hashed assignment
+        if to_vertex not in self.adjacency_list[from_vertex]:
+            self._edge_count += 1
+        self.adjacency_list[from_vertex][to_vertex] = weight
 
         # If undirected, add reverse edge
         if not self.directed:
-            self.adjacency_list[to_vertex].append((from_vertex, weight))
+            self.adjacency_list[to_vertex][from_vertex] = weight
 
+        self._version += 1
         return True
 
+    def add_edges(self, edges):
+        """
+        Add many edges in a single call.
+
+        Amortizes the per-call overhead of add_edge (attribute lookup,
+        bound-method dispatch) by hoisting the shared state into locals
+        and looping once over the batch.
+
+        Args:
+            edges: Iterable of (from_vertex, to_vertex, weight) triples
+
+        Returns:
+            int: Number of edges applied (pairs with missing vertices
+                 are skipped)
+        """
+        adj = self.adjacency_list
+        directed = self.directed
+        edge_count = self._edge_count
+        added = 0
+
+        for from_vertex, to_vertex, weight in edges:
+            row = adj.get(from_vertex)
+            if row is None or to_vertex not in adj:
+                continue
+
+            if to_vertex not in row:
+                edge_count += 1
+            row[to_vertex] = weight
+
+            if not directed:
+                adj[to_vertex][from_vertex] = weight
+
+            added += 1
+
+        self._edge_count = edge_count
+        if added:
+            self._version += 1
+        return added
+
     def remove_edge(self, from_vertex, to_vertex):
         """
         Remove an edge between two vertices.
@@ -96,19 +157,15 @@ class GraphAdjacencyList:
         if from_vertex not in self.adjacency_list or to_vertex not in self.adjacency_list:
             return False
 
-        # Remove edge from adjacency list
-        self.adjacency_list[from_vertex] = [
-            (neighbor, weight) for neighbor, weight in self.adjacency_list[from_vertex]
-            if neighbor != to_vertex
-        ]
+        # Remove edge with a single hashed pop per direction
+        if self.adjacency_list[from_vertex].pop(to_vertex, None) is not None:
+            self._edge_count -= 1
 
         # If undirected, remove reverse edge
         if not self.directed:
-            self.adjacency_list[to_vertex] = [
-                (neighbor, weight) for neighbor, weight in self.adjacency_list[to_vertex]
-                if neighbor != from_vertex
-            ]
+            self.adjacency_list[to_vertex].pop(from_vertex, None)
 
+        self._version += 1
         return True
 
     def has_edge(self, from_vertex, to_vertex):
@@ -125,11 +182,7 @@ class GraphAdjacencyList:
         if from_vertex not in self.adjacency_list:
             return False
 
-        for neighbor, _ in self.adjacency_list[from_vertex]:
-            if neighbor == to_vertex:
-                return True
-
-        return False
+        return to_vertex in self.adjacency_list[from_vertex]
 
     def get_edge_weight(self, from_vertex, to_vertex):
         """
@@ -145,11 +198,19 @@ class GraphAdjacencyList:
         if from_vertex not in self.adjacency_list:
             return None
 
-        for neighbor, weight in self.adjacency_list[from_vertex]:
-            if neighbor == to_vertex:
-                return weight
+        return self.adjacency_list[from_vertex].get(to_vertex)
+
+    def has_vertex(self, vertex):
+        """
+        Check if a vertex exists in the graph.
+
+        Args:
+            vertex: The vertex label to check
 
-        return None
+        Returns:
+            bool: True if the vertex exists
+        """
+        return vertex in self.adjacency_list
 
     def get_neighbors(self, vertex):
         """
@@ -164,7 +225,62 @@ class GraphAdjacencyList:
         if vertex not in self.adjacency_list:
             return []
 
-        return self.adjacency_list[vertex].copy()
+        return list(self.adjacency_list[vertex].items())
+
+    def iter_neighbors(self, vertex):
+        """
+        Iterate over the neighbors of a vertex without building a list.
+
+        Preferred over get_neighbors on hot paths that only walk the
+        neighbors once, since no snapshot list is allocated.
+
+        Args:
+            vertex: The vertex to iterate neighbors for
+
+        Returns:
+            iterator: Iterator of (neighbor, weight) pairs
+        """
+        if vertex not in self.adjacency_list:
+            return iter(())
+
+        return iter(self.adjacency_list[vertex].items())
+
+    def get_degree(self, vertex):
+        """
+        Get the number of neighbors of a vertex.
+
+        O(1), unlike len(get_neighbors(vertex)) which materializes the
+        neighbor list just to count it.
+
+        Args:
+            vertex: The vertex to get the degree of
+
+        Returns:
+            int: Number of neighbors, or 0 if the vertex doesn't exist
+        """
+        neighbors = self.adjacency_list.get(vertex)
+        return len(neighbors) if neighbors is not None else 0
+
+    def get_neighbors_arrays(self, vertex):
+        """
+        Get the neighbors of a vertex as two parallel sequences.
+
+        Structure-of-arrays companion to get_neighbors: hot loops index
+        the labels and weights side by side instead of unpacking a
+        (neighbor, weight) tuple per edge, and each sequence is built
+        with a single C-level call over the underlying dict.
+
+        Args:
+            vertex: The vertex to get neighbors for
+
+        Returns:
+            tuple: (labels, weights) parallel tuples
+        """
+        neighbors = self.adjacency_list.get(vertex)
+        if not neighbors:
+            return (), ()
+
+        return tuple(neighbors), tuple(neighbors.values())
 
     def get_vertices(self):
         """
@@ -191,30 +307,56 @@ class GraphAdjacencyList:
         Returns:
             int: Number of edges
         """
-        count = 0
-        for neighbors in self.adjacency_list.values():
-            count += len(neighbors)
+        return self._edge_count
 
-        # For undirected graphs, each edge is counted twice
-        if not self.directed:
-            count //= 2
+    def to_csr(self):
+        """
+        Build a Compressed-Sparse-Row snapshot of the graph.
 
-        return count
+        Vertices are numbered 0..V-1 in insertion order; the neighbors of
+        vertex i are indices[indptr[i]:indptr[i+1]] with parallel weights
+        in data. The flat arrays are contiguous and cheap to iterate,
+        which suits read-heavy traversals.
+
+        Returns:
+            tuple: (vertices, indptr, indices, data) where vertices maps
+                   index -> label and the remaining three are flat arrays
+        """
+        vertices = list(self.adjacency_list.keys())
+        index = {v: i for i, v in enumerate(vertices)}
+
+        indptr = array('l', [0])
+        indices = array('l')
+        data = array('d')
+
+        for vertex in vertices:
+            neighbors = self.adjacency_list[vertex]
+            indices.extend(index[n] for n in neighbors)
+            data.extend(neighbors.values())
+            indptr.append(len(indices))
+
+        return vertices, indptr, indices, data
 
     def display(self):
         """
         Display the adjacency list representation of the graph.
+        Builds the full output in memory and writes it in one call,
+        instead of issuing a print per vertex.
         """
-        print("\n" + "="*60)
-        print("ADJACENCY LIST REPRESENTATION")
-        print("="*60)
-        print(f"Type: {'Directed' if self.directed else 'Undirected'}, "
-              f"{'Weighted' if self.weighted else 'Unweighted'}")
-        print(f"Vertices: {len(self.adjacency_list)}, Edges: {self.get_edge_count()}")
-        print("-"*60)
+        lines = [
+            "",
+            "="*60,
+            "ADJACENCY LIST REPRESENTATION",
+            "="*60,
+            f"Type: {'Directed' if self.directed else 'Undirected'}, "
+            f"{'Weighted' if self.weighted else 'Unweighted'}",
+            f"Vertices: {len(self.adjacency_list)}, Edges: {self.get_edge_count()}",
+            "-"*60,
+        ]
 
         if not self.adjacency_list:
-            print("Empty graph")
+            lines.append("Empty graph")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
 
         # Sort vertices for consistent display
@@ -224,12 +366,13 @@ class GraphAdjacencyList:
             neighbors = self.adjacency_list[vertex]
             if neighbors:
                 neighbor_strs = [f"{n}({w})" if self.weighted else str(n)
-                               for n, w in neighbors]
-                print(f"{vertex:>8} -> {', '.join(neighbor_strs)}")
+                               for n, w in neighbors.items()]
+                lines.append(f"{vertex:>8} -> {', '.join(neighbor_strs)}")
             else:
-                print(f"{vertex:>8} -> (no edges)")
+                lines.append(f"{vertex:>8} -> (no edges)")
 
-        print("="*60 + "\n")
+        lines.append("="*60 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def __str__(self):
         """String representation of the graph."""
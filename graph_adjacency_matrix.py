@@ -1,9 +1,16 @@
 """
 Graph implementation using Adjacency Matrix representation.
 This representation uses a 2D matrix where matrix[i][j] represents
-the edge weight between vertex i and vertex j.
+the edge weight between vertex i and vertex j. Weighted matrices are
+stored as a single flat, contiguous array of doubles in row-major
+order; unweighted matrices are bit-packed, with each row held as one
+Python int bitmask so a cell costs a single bit instead of a boxed
+Python object.
 """
 
+import sys
+from array import array
+
 
 class GraphAdjacencyMatrix:
     """
@@ -11,7 +18,7 @@ class GraphAdjacencyMatrix:
     Suitable for dense graphs where edge lookup is frequent.
 
     Time Complexity:
-    - Add vertex: O(V²) - needs to resize matrix
+    - Add vertex: O(V) amortized - matrix capacity grows geometrically
     - Add edge: O(1)
     - Remove edge: O(1)
     - Check edge: O(1)
@@ -31,8 +38,19 @@ class GraphAdjacencyMatrix:
         self.directed = directed
         self.weighted = weighted
         self.vertices = []  # List to map indices to vertex labels
-        self.matrix = []    # Adjacency matrix
         self.vertex_map = {}  # Map vertex labels to indices
+        self._edge_count = 0  # Maintained incrementally by add_edge/remove_edge
+        self._version = 0  # Bumped on every mutation; lets caches detect staleness
+        if weighted:
+            # Flat row-major adjacency matrix of doubles: cell (i, j)
+            # lives at index i*capacity + j. Capacity doubles when full,
+            # so add_vertex stops paying a full-matrix copy per call
+            self._capacity = 0
+            self._matrix = array('d')
+        else:
+            # Bit-packed matrix: row i is a single int whose bit j marks
+            # the edge (i, j); Python ints grow as columns are added
+            self._bits = []
 
     def add_vertex(self, vertex):
         """
@@ -52,15 +70,85 @@ class GraphAdjacencyMatrix:
         index = len(self.vertices) - 1
         self.vertex_map[vertex] = index
 
-        # Expand the matrix
-        # Add a new row
-        self.matrix.append([0] * len(self.vertices))
+        if self.weighted:
+            # Grow capacity geometrically; between growths the new
+            # vertex's row and column already exist (zeroed) in the
+            # preallocated matrix, so no copying is needed
+            if index + 1 > self._capacity:
+                old_cap = self._capacity
+                new_cap = max(8, 2 * old_cap)
+                new_matrix = array('d', bytes(new_cap * new_cap * 8))
+                for i in range(index):
+                    new_matrix[i * new_cap:i * new_cap + index] = \
+                        self._matrix[i * old_cap:i * old_cap + index]
+                self._matrix = new_matrix
+                self._capacity = new_cap
+        else:
+            # Bit rows widen automatically; just add the new empty row
+            self._bits.append(0)
+
+        self._version += 1
+        return True
 
-        # Add a new column to all existing rows
-        for i in range(len(self.matrix) - 1):
-            self.matrix[i].append(0)
+    def add_vertices(self, vertices):
+        """
+        Add many vertices in a single call.
 
-        return True
+        Sizes the batch first so a weighted matrix grows to its final
+        capacity with one allocation and one copy, instead of paying a
+        growth step every few vertices as add_vertex would.
+
+        Args:
+            vertices: Iterable of vertex labels
+
+        Returns:
+            int: Number of vertices actually added
+        """
+        vertex_map = self.vertex_map
+        new_vertices = [v for v in dict.fromkeys(vertices)
+                        if v not in vertex_map]
+        if not new_vertices:
+            return 0
+
+        count = len(self.vertices)
+        if self.weighted:
+            needed = count + len(new_vertices)
+            if needed > self._capacity:
+                old_cap = self._capacity
+                new_cap = max(8, 2 * old_cap)
+                while new_cap < needed:
+                    new_cap *= 2
+                new_matrix = array('d', bytes(new_cap * new_cap * 8))
+                for i in range(count):
+                    new_matrix[i * new_cap:i * new_cap + count] = \
+                        self._matrix[i * old_cap:i * old_cap + count]
+                self._matrix = new_matrix
+                self._capacity = new_cap
+
+            for vertex in new_vertices:
+                self.vertices.append(vertex)
+                vertex_map[vertex] = count
+                count += 1
+        else:
+            bits = self._bits
+            for vertex in new_vertices:
+                self.vertices.append(vertex)
+                vertex_map[vertex] = count
+                count += 1
+                bits.append(0)
+
+        self._version += 1
+        return len(new_vertices)
+
+    def _unbox(self, weight):
+        """
+        Convert a stored cell value back to a clean Python number.
+        Weighted matrices store doubles, so integral weights come back
+        as floats (4.0); convert those back to ints for display/API parity.
+        """
+        if self.weighted and isinstance(weight, float) and weight.is_integer():
+            return int(weight)
+        return weight
 
     def add_edge(self, from_vertex, to_vertex, weight=1):
         """
@@ -80,15 +168,86 @@ class GraphAdjacencyMatrix:
         from_idx = self.vertex_map[from_vertex]
         to_idx = self.vertex_map[to_vertex]
 
-        # Add edge
-        self.matrix[from_idx][to_idx] = weight
+        if self.weighted:
+            cap = self._capacity
+
+            # Add edge (only count it if the cell was previously empty)
+            if self._matrix[from_idx * cap + to_idx] == 0 and weight != 0:
+                self._edge_count += 1
+            self._matrix[from_idx * cap + to_idx] = weight
+
+            # If undirected, add reverse edge
+            if not self.directed:
+                self._matrix[to_idx * cap + from_idx] = weight
+        else:
+            # Set bit (i, j); unweighted graphs record presence only
+            if not (self._bits[from_idx] >> to_idx) & 1:
+                self._edge_count += 1
+            self._bits[from_idx] |= 1 << to_idx
 
-        # If undirected, add reverse edge
-        if not self.directed:
-            self.matrix[to_idx][from_idx] = weight
+            # If undirected, set reverse bit
+            if not self.directed:
+                self._bits[to_idx] |= 1 << from_idx
 
+        self._version += 1
         return True
 
+    def add_edges(self, edges):
+        """
+        Add many edges in a single call.
+
+        Amortizes the per-call overhead of add_edge by resolving the
+        storage (flat matrix or bit rows) and the vertex map into locals
+        once, then looping over the batch.
+
+        Args:
+            edges: Iterable of (from_vertex, to_vertex, weight) triples
+
+        Returns:
+            int: Number of edges applied (pairs with missing vertices
+                 are skipped)
+        """
+        vertex_map = self.vertex_map
+        directed = self.directed
+        edge_count = self._edge_count
+        added = 0
+
+        if self.weighted:
+            matrix = self._matrix
+            cap = self._capacity
+            for from_vertex, to_vertex, weight in edges:
+                from_idx = vertex_map.get(from_vertex)
+                to_idx = vertex_map.get(to_vertex)
+                if from_idx is None or to_idx is None:
+                    continue
+
+                cell = from_idx * cap + to_idx
+                if matrix[cell] == 0 and weight != 0:
+                    edge_count += 1
+                matrix[cell] = weight
+                if not directed:
+                    matrix[to_idx * cap + from_idx] = weight
+                added += 1
+        else:
+            bits = self._bits
+            for from_vertex, to_vertex, weight in edges:
+                from_idx = vertex_map.get(from_vertex)
+                to_idx = vertex_map.get(to_vertex)
+                if from_idx is None or to_idx is None:
+                    continue
+
+                if not (bits[from_idx] >> to_idx) & 1:
+                    edge_count += 1
+                bits[from_idx] |= 1 << to_idx
+                if not directed:
+                    bits[to_idx] |= 1 << from_idx
+                added += 1
+
+        self._edge_count = edge_count
+        if added:
+            self._version += 1
+        return added
+
     def remove_edge(self, from_vertex, to_vertex):
         """
         Remove an edge between two vertices.
@@ -106,13 +265,28 @@ class GraphAdjacencyMatrix:
         from_idx = self.vertex_map[from_vertex]
         to_idx = self.vertex_map[to_vertex]
 
-        # Remove edge
-        self.matrix[from_idx][to_idx] = 0
+        if self.weighted:
+            cap = self._capacity
+
+            # Remove edge (only decrement if the edge actually existed)
+            if self._matrix[from_idx * cap + to_idx] != 0:
+                self._edge_count -= 1
+            self._matrix[from_idx * cap + to_idx] = 0
 
-        # If undirected, remove reverse edge
-        if not self.directed:
-            self.matrix[to_idx][from_idx] = 0
+            # If undirected, remove reverse edge
+            if not self.directed:
+                self._matrix[to_idx * cap + from_idx] = 0
+        else:
+            # Clear bit (i, j) (only decrement if the edge actually existed)
+            if (self._bits[from_idx] >> to_idx) & 1:
+                self._edge_count -= 1
+            self._bits[from_idx] &= ~(1 << to_idx)
 
+            # If undirected, clear reverse bit
+            if not self.directed:
+                self._bits[to_idx] &= ~(1 << from_idx)
+
+        self._version += 1
         return True
 
     def has_edge(self, from_vertex, to_vertex):
@@ -132,7 +306,10 @@ class GraphAdjacencyMatrix:
         from_idx = self.vertex_map[from_vertex]
         to_idx = self.vertex_map[to_vertex]
 
-        return self.matrix[from_idx][to_idx] != 0
+        if self.weighted:
+            return self._matrix[from_idx * self._capacity + to_idx] != 0
+
+        return bool((self._bits[from_idx] >> to_idx) & 1)
 
     def get_edge_weight(self, from_vertex, to_vertex):
         """
@@ -148,10 +325,25 @@ class GraphAdjacencyMatrix:
         if not self.has_edge(from_vertex, to_vertex):
             return None
 
+        if not self.weighted:
+            return 1
+
         from_idx = self.vertex_map[from_vertex]
         to_idx = self.vertex_map[to_vertex]
 
-        return self.matrix[from_idx][to_idx]
+        return self._unbox(self._matrix[from_idx * self._capacity + to_idx])
+
+    def has_vertex(self, vertex):
+        """
+        Check if a vertex exists in the graph.
+
+        Args:
+            vertex: The vertex label to check
+
+        Returns:
+            bool: True if the vertex exists
+        """
+        return vertex in self.vertex_map
 
     def get_neighbors(self, vertex):
         """
@@ -163,17 +355,85 @@ class GraphAdjacencyMatrix:
         Returns:
             list: List of (neighbor, weight) tuples
         """
+        return list(self.iter_neighbors(vertex))
+
+    def iter_neighbors(self, vertex):
+        """
+        Iterate over the neighbors of a vertex without building a list.
+
+        Preferred over get_neighbors on hot paths that only walk the
+        neighbors once, since no snapshot list is allocated.
+
+        Args:
+            vertex: The vertex to iterate neighbors for
+
+        Returns:
+            iterator: Iterator of (neighbor, weight) pairs
+        """
         if vertex not in self.vertex_map:
-            return []
+            return
 
         vertex_idx = self.vertex_map[vertex]
-        neighbors = []
 
-        for i, weight in enumerate(self.matrix[vertex_idx]):
-            if weight != 0:
-                neighbors.append((self.vertices[i], weight))
+        if self.weighted:
+            row_start = vertex_idx * self._capacity
+            for i, weight in enumerate(self._matrix[row_start:row_start + len(self.vertices)]):
+                if weight != 0:
+                    yield self.vertices[i], self._unbox(weight)
+        else:
+            # Walk the set bits of the row, lowest first
+            row = self._bits[vertex_idx]
+            while row:
+                i = (row & -row).bit_length() - 1
+                yield self.vertices[i], 1
+                row &= row - 1
+
+    def get_degree(self, vertex):
+        """
+        Get the number of neighbors of a vertex.
+
+        Counts non-zero cells in the vertex's row directly (a popcount
+        for bit-packed rows), without building the neighbor list.
+
+        Args:
+            vertex: The vertex to get the degree of
+
+        Returns:
+            int: Number of neighbors, or 0 if the vertex doesn't exist
+        """
+        if vertex not in self.vertex_map:
+            return 0
+
+        vertex_idx = self.vertex_map[vertex]
 
-        return neighbors
+        if self.weighted:
+            row_start = vertex_idx * self._capacity
+            row = self._matrix[row_start:row_start + len(self.vertices)]
+            return len(row) - row.count(0)
+
+        return self._bits[vertex_idx].bit_count()
+
+    def get_neighbors_arrays(self, vertex):
+        """
+        Get the neighbors of a vertex as two parallel sequences.
+
+        Structure-of-arrays companion to get_neighbors: hot loops index
+        the labels and weights side by side instead of unpacking a
+        (neighbor, weight) tuple per edge.
+
+        Args:
+            vertex: The vertex to get neighbors for
+
+        Returns:
+            tuple: (labels, weights) parallel tuples
+        """
+        labels = []
+        weights = []
+        for neighbor, weight in self.iter_neighbors(vertex):
+            labels.append(neighbor)
+            weights.append(weight)
+
+        return tuple(labels), tuple(weights)
 
     def get_vertices(self):
         """
@@ -200,51 +460,87 @@ class GraphAdjacencyMatrix:
         Returns:
             int: Number of edges
         """
-        count = 0
-        for i in range(len(self.matrix)):
-            for j in range(len(self.matrix[i])):
-                if self.matrix[i][j] != 0:
-                    count += 1
+        return self._edge_count
+
+    def to_csr(self):
+        """
+        Build a Compressed-Sparse-Row snapshot of the graph.
 
-        # For undirected graphs, each edge is counted twice
-        if not self.directed:
-            count //= 2
+        Vertices are numbered 0..V-1 in insertion order; the neighbors of
+        vertex i are indices[indptr[i]:indptr[i+1]] with parallel weights
+        in data. Traversals over the snapshot avoid re-scanning full
+        matrix rows for every get_neighbors call.
 
-        return count
+        Returns:
+            tuple: (vertices, indptr, indices, data) where vertices maps
+                   index -> label and the remaining three are flat arrays
+        """
+        vertices = self.vertices.copy()
+        n = len(vertices)
+
+        indptr = array('l', [0])
+        indices = array('l')
+        data = array('d')
+
+        if self.weighted:
+            cap = self._capacity
+            for i in range(n):
+                row = self._matrix[i * cap:i * cap + n]
+                for j, weight in enumerate(row):
+                    if weight != 0:
+                        indices.append(j)
+                        data.append(weight)
+                indptr.append(len(indices))
+        else:
+            for i in range(n):
+                row = self._bits[i]
+                while row:
+                    indices.append((row & -row).bit_length() - 1)
+                    data.append(1)
+                    row &= row - 1
+                indptr.append(len(indices))
+
+        return vertices, indptr, indices, data
 
     def display(self):
         """
         Display the adjacency matrix representation of the graph.
+        Builds the full output in memory and writes it in one call,
+        instead of issuing O(V²) individual prints.
         """
-        print("\n" + "="*60)
-        print("ADJACENCY MATRIX REPRESENTATION")
-        print("="*60)
-        print(f"Type: {'Directed' if self.directed else 'Undirected'}, "
-              f"{'Weighted' if self.weighted else 'Unweighted'}")
-        print(f"Vertices: {len(self.vertices)}, Edges: {self.get_edge_count()}")
-        print("-"*60)
+        lines = [
+            "",
+            "="*60,
+            "ADJACENCY MATRIX REPRESENTATION",
+            "="*60,
+            f"Type: {'Directed' if self.directed else 'Undirected'}, "
+            f"{'Weighted' if self.weighted else 'Unweighted'}",
+            f"Vertices: {len(self.vertices)}, Edges: {self.get_edge_count()}",
+            "-"*60,
+        ]
 
         if not self.vertices:
-            print("Empty graph")
+            lines.append("Empty graph")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
 
-        # Print header
-        print(f"{'':>8}", end="")
-        for vertex in self.vertices:
-            print(f"{str(vertex):>8}", end="")
-        print()
+        # Header row
+        lines.append(" "*8 + "".join(f"{str(v):>8}" for v in self.vertices))
 
-        # Print matrix
+        # Matrix rows
+        n = len(self.vertices)
         for i, vertex in enumerate(self.vertices):
-            print(f"{str(vertex):>8}", end="")
-            for j in range(len(self.vertices)):
-                weight = self.matrix[i][j]
-                if weight == 0:
-                    print(f"{'·':>8}", end="")
+            cells = []
+            for j in range(n):
+                if self.weighted:
+                    weight = self._unbox(self._matrix[i * self._capacity + j])
                 else:
-                    print(f"{weight:>8}", end="")
-            print()
-        print("="*60 + "\n")
+                    weight = (self._bits[i] >> j) & 1
+                cells.append(f"{'·':>8}" if weight == 0 else f"{weight:>8}")
+            lines.append(f"{str(vertex):>8}" + "".join(cells))
+
+        lines.append("="*60 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def __str__(self):
         """String representation of the graph."""
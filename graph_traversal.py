@@ -4,6 +4,33 @@ These algorithms work with both adjacency matrix and adjacency list representati
 """
 
 from collections import deque
+from functools import lru_cache
+from itertools import islice
+
+
+@lru_cache(maxsize=4096)
+def _str_label(vertex):
+    """
+    Memoized str() of a vertex label.
+
+    Rank dicts already keep str() out of per-comparison hot paths, but
+    each traversal still converts every label once while building its
+    rank. Repeated traversals of the same graph (the common case in the
+    demos and benchmarks) hit this cache instead of re-formatting.
+    """
+    return str(vertex)
+
+
+def _preview(items, limit=16):
+    """
+    Render a bounded preview of a queue/stack for trace output.
+    Materializing the full container per step is O(V) each time, which
+    dominates traversal cost on large graphs, so show only the head.
+    """
+    head = list(islice(items, limit + 1))
+    if len(head) > limit:
+        return "[" + ", ".join(map(str, head[:limit])) + ", ...]"
+    return "[" + ", ".join(map(str, head)) + "]"
 
 
 class GraphTraversal:
@@ -12,7 +39,8 @@ class GraphTraversal:
     """
 
     @staticmethod
-    def depth_first_search(graph, start_vertex, verbose=True):
+    def depth_first_search(graph, start_vertex, verbose=True, deterministic=True,
+                           trace_queue=False):
         """
         Perform depth-first search starting from a given vertex.
         DFS explores as far as possible along each branch before backtracking.
@@ -24,20 +52,31 @@ class GraphTraversal:
             graph: Graph object (adjacency matrix or list)
             start_vertex: Starting vertex for traversal
             verbose: Whether to print step-by-step output
+            deterministic: Whether to sort neighbors for a reproducible
+                           order; with False, order follows edge insertion
+                           and the per-visit sort is skipped entirely
+            trace_queue: Whether verbose output includes a (bounded)
+                         preview of the stack before/after each step
 
         Returns:
             list: List of vertices in DFS order
         """
-        if start_vertex not in graph.get_vertices():
+        if not graph.has_vertex(start_vertex):
             if verbose:
                 print(f"Error: Start vertex '{start_vertex}' not in graph")
             return []
 
+        total = graph.get_vertex_count()
         visited = set()
         traversal_order = []
         stack = [start_vertex]
         step = 0
 
+        # Rank vertices once so per-visit neighbor sorts compare plain ints
+        # instead of calling str() on every comparison
+        if deterministic:
+            rank = {v: i for i, v in enumerate(sorted(graph.get_vertices(), key=_str_label))}
+
         if verbose:
             print("\n" + "="*60)
             print("DEPTH-FIRST SEARCH (DFS)")
@@ -56,106 +95,123 @@ class GraphTraversal:
 
                 if verbose:
                     print(f"Step {step}: Visit {vertex}")
-                    print(f"  Stack before: {stack}")
+                    if trace_queue:
+                        print(f"  Stack before: {_preview(stack)}")
 
                 # Get neighbors and add to stack in reverse order
                 # (so they are processed in the correct order when popped)
-                neighbors = graph.get_neighbors(vertex)
                 # Sort neighbors to ensure consistent ordering
-                neighbors_sorted = sorted([(n, w) for n, w in neighbors],
-                                        key=lambda x: str(x[0]), reverse=True)
-
-                unvisited_neighbors = []
-                for neighbor, weight in neighbors_sorted:
-                    if neighbor not in visited:
-                        stack.append(neighbor)
-                        unvisited_neighbors.append(neighbor)
+                if deterministic:
+                    neighbors = graph.get_neighbors(vertex)
+                    neighbors_sorted = sorted(neighbors, key=lambda nw: rank[nw[0]],
+                                              reverse=True)
+                elif verbose:
+                    neighbors = graph.get_neighbors(vertex)
+                    neighbors_sorted = neighbors
+                else:
+                    # Single quiet pass: iterate lazily, no snapshot list
+                    neighbors_sorted = graph.iter_neighbors(vertex)
 
                 if verbose:
+                    unvisited_neighbors = []
+                    for neighbor, weight in neighbors_sorted:
+                        if neighbor not in visited:
+                            stack.append(neighbor)
+                            unvisited_neighbors.append(neighbor)
+
                     print(f"  Neighbors: {[n for n, _ in neighbors]}")
                     print(f"  Added to stack: {unvisited_neighbors}")
-                    print(f"  Stack after: {stack}")
+                    if trace_queue:
+                        print(f"  Stack after: {_preview(stack)}")
                     print(f"  Visited so far: {traversal_order}")
                     print()
+                else:
+                    # Quiet path: no bookkeeping lists, just the pushes
+                    for neighbor, weight in neighbors_sorted:
+                        if neighbor not in visited:
+                            stack.append(neighbor)
 
         if verbose:
             print(f"DFS Complete!")
             print(f"Traversal order: {' -> '.join(map(str, traversal_order))}")
-            print(f"Vertices visited: {len(traversal_order)} / {graph.get_vertex_count()}")
+            print(f"Vertices visited: {len(traversal_order)} / {total}")
             print("="*60 + "\n")
 
         return traversal_order
 
     @staticmethod
-    def depth_first_search_recursive(graph, start_vertex, visited=None,
-                                     traversal_order=None, verbose=True, step_counter=None):
+    def depth_first_search_recursive(graph, start_vertex, verbose=True):
         """
-        Perform depth-first search recursively.
+        Perform depth-first search in recursive visiting order.
+
+        Implemented with an explicit stack of neighbor iterators instead of
+        actual recursion: this produces the same traversal order as the
+        recursive formulation but avoids a Python call frame per vertex and
+        the interpreter recursion limit on long chains.
 
         Args:
             graph: Graph object (adjacency matrix or list)
             start_vertex: Starting vertex for traversal
-            visited: Set of visited vertices
-            traversal_order: List to store traversal order
             verbose: Whether to print step-by-step output
-            step_counter: List with one element to track step number
 
         Returns:
             list: List of vertices in DFS order
         """
-        # Initialize on first call
-        if visited is None:
-            visited = set()
-            traversal_order = []
-            step_counter = [0]
+        if verbose:
+            print("\n" + "="*60)
+            print("DEPTH-FIRST SEARCH (DFS) - RECURSIVE")
+            print("="*60)
+            print(f"Starting vertex: {start_vertex}")
+            print(f"Graph type: {type(graph).__name__}")
+            print("-"*60)
 
-            if verbose:
-                print("\n" + "="*60)
-                print("DEPTH-FIRST SEARCH (DFS) - RECURSIVE")
-                print("="*60)
-                print(f"Starting vertex: {start_vertex}")
-                print(f"Graph type: {type(graph).__name__}")
-                print("-"*60)
+        if not graph.has_vertex(start_vertex):
+            return []
 
-        if start_vertex not in graph.get_vertices():
-            return traversal_order
+        total = graph.get_vertex_count()
 
-        # Visit current vertex
-        visited.add(start_vertex)
-        traversal_order.append(start_vertex)
-        step_counter[0] += 1
+        # Rank vertices once for deterministic neighbor ordering
+        rank = {v: i for i, v in enumerate(sorted(graph.get_vertices(), key=_str_label))}
 
-        if verbose:
-            print(f"Step {step_counter[0]}: Visit {start_vertex}")
+        def neighbor_iter(vertex):
+            return iter(sorted(graph.get_neighbors(vertex), key=lambda nw: rank[nw[0]]))
 
-        # Get and sort neighbors for consistent ordering
-        neighbors = graph.get_neighbors(start_vertex)
-        neighbors_sorted = sorted([(n, w) for n, w in neighbors], key=lambda x: str(x[0]))
+        visited = {start_vertex}
+        traversal_order = [start_vertex]
+        stack = [neighbor_iter(start_vertex)]
 
         if verbose:
-            print(f"  Neighbors: {[n for n, _ in neighbors]}")
+            print(f"Step 1: Visit {start_vertex}")
+            print(f"  Neighbors: {[n for n, _ in graph.get_neighbors(start_vertex)]}")
 
-        # Recursively visit unvisited neighbors
-        for neighbor, weight in neighbors_sorted:
-            if neighbor not in visited:
-                if verbose:
-                    print(f"  Recursing into {neighbor}")
-                GraphTraversal.depth_first_search_recursive(
-                    graph, neighbor, visited, traversal_order, verbose, step_counter
-                )
+        while stack:
+            for neighbor, weight in stack[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    traversal_order.append(neighbor)
 
-        # Print completion on final return
-        if len(visited) == len(traversal_order) and step_counter[0] == len(traversal_order):
-            if verbose:
-                print(f"\nDFS Complete!")
-                print(f"Traversal order: {' -> '.join(map(str, traversal_order))}")
-                print(f"Vertices visited: {len(traversal_order)} / {graph.get_vertex_count()}")
-                print("="*60 + "\n")
+                    if verbose:
+                        print(f"  Recursing into {neighbor}")
+                        print(f"Step {len(traversal_order)}: Visit {neighbor}")
+                        print(f"  Neighbors: {[n for n, _ in graph.get_neighbors(neighbor)]}")
+
+                    stack.append(neighbor_iter(neighbor))
+                    break
+            else:
+                # Current vertex exhausted; "return" to its parent
+                stack.pop()
+
+        if verbose:
+            print(f"\nDFS Complete!")
+            print(f"Traversal order: {' -> '.join(map(str, traversal_order))}")
+            print(f"Vertices visited: {len(traversal_order)} / {total}")
+            print("="*60 + "\n")
 
         return traversal_order
 
     @staticmethod
-    def breadth_first_search(graph, start_vertex, verbose=True):
+    def breadth_first_search(graph, start_vertex, verbose=True, deterministic=True,
+                             trace_queue=False):
         """
         Perform breadth-first search starting from a given vertex.
         BFS explores all neighbors at the present depth before moving to vertices at the next depth.
@@ -167,21 +223,32 @@ class GraphTraversal:
             graph: Graph object (adjacency matrix or list)
             start_vertex: Starting vertex for traversal
             verbose: Whether to print step-by-step output
+            deterministic: Whether to sort neighbors for a reproducible
+                           order; with False, order follows edge insertion
+                           and the per-visit sort is skipped entirely
+            trace_queue: Whether verbose output includes a (bounded)
+                         preview of the queue before/after each step
 
         Returns:
             list: List of vertices in BFS order
         """
-        if start_vertex not in graph.get_vertices():
+        if not graph.has_vertex(start_vertex):
             if verbose:
                 print(f"Error: Start vertex '{start_vertex}' not in graph")
             return []
 
+        total = graph.get_vertex_count()
         visited = set()
         traversal_order = []
         queue = deque([start_vertex])
         visited.add(start_vertex)
         step = 0
 
+        # Rank vertices once so per-visit neighbor sorts compare plain ints
+        # instead of calling str() on every comparison
+        if deterministic:
+            rank = {v: i for i, v in enumerate(sorted(graph.get_vertices(), key=_str_label))}
+
         if verbose:
             print("\n" + "="*60)
             print("BREADTH-FIRST SEARCH (BFS)")
@@ -197,31 +264,45 @@ class GraphTraversal:
 
             if verbose:
                 print(f"Step {step}: Visit {vertex}")
-                print(f"  Queue before: {list(queue)}")
-
-            # Get neighbors
-            neighbors = graph.get_neighbors(vertex)
-            # Sort neighbors for consistent ordering
-            neighbors_sorted = sorted([(n, w) for n, w in neighbors], key=lambda x: str(x[0]))
+                if trace_queue:
+                    print(f"  Queue before: {_preview(queue)}")
 
-            added_neighbors = []
-            for neighbor, weight in neighbors_sorted:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
-                    added_neighbors.append(neighbor)
+            # Get neighbors and sort for consistent ordering
+            if deterministic:
+                neighbors = graph.get_neighbors(vertex)
+                neighbors_sorted = sorted(neighbors, key=lambda nw: rank[nw[0]])
+            elif verbose:
+                neighbors = graph.get_neighbors(vertex)
+                neighbors_sorted = neighbors
+            else:
+                # Single quiet pass: iterate lazily, no snapshot list
+                neighbors_sorted = graph.iter_neighbors(vertex)
 
             if verbose:
+                added_neighbors = []
+                for neighbor, weight in neighbors_sorted:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        queue.append(neighbor)
+                        added_neighbors.append(neighbor)
+
                 print(f"  Neighbors: {[n for n, _ in neighbors]}")
                 print(f"  Added to queue: {added_neighbors}")
-                print(f"  Queue after: {list(queue)}")
+                if trace_queue:
+                    print(f"  Queue after: {_preview(queue)}")
                 print(f"  Visited so far: {traversal_order}")
                 print()
+            else:
+                # Quiet path: no bookkeeping lists, just the enqueues
+                for neighbor, weight in neighbors_sorted:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        queue.append(neighbor)
 
         if verbose:
             print(f"BFS Complete!")
             print(f"Traversal order: {' -> '.join(map(str, traversal_order))}")
-            print(f"Vertices visited: {len(traversal_order)} / {graph.get_vertex_count()}")
+            print(f"Vertices visited: {len(traversal_order)} / {total}")
             print("="*60 + "\n")
 
         return traversal_order
@@ -241,30 +322,43 @@ class GraphTraversal:
         Returns:
             list: List of paths, where each path is a list of vertices
         """
-        if start_vertex not in graph.get_vertices() or end_vertex not in graph.get_vertices():
+        if not graph.has_vertex(start_vertex) or not graph.has_vertex(end_vertex):
             return []
 
         all_paths = []
 
-        def dfs_paths(current, target, path, visited):
-            if len(all_paths) >= max_paths:
-                return
-
-            if current == target:
-                all_paths.append(path.copy())
-                return
-
-            neighbors = graph.get_neighbors(current)
-            for neighbor, weight in neighbors:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    path.append(neighbor)
-                    dfs_paths(neighbor, target, path, visited)
-                    path.pop()
-                    visited.remove(neighbor)
-
-        visited = {start_vertex}
-        dfs_paths(start_vertex, end_vertex, [start_vertex], visited)
+        if start_vertex == end_vertex:
+            all_paths.append([start_vertex])
+        else:
+            # Iterative DFS over the CSR snapshot: integer vertex ids and a
+            # bytearray visited bitmap keep all hashing out of the
+            # exponential inner loop; labels are restored only when a
+            # complete path is recorded
+            vertices, indptr, indices, _ = graph.to_csr()
+            index = {v: i for i, v in enumerate(vertices)}
+            start, end = index[start_vertex], index[end_vertex]
+
+            visited = bytearray(len(vertices))
+            visited[start] = 1
+            path = [start]
+            stack = [iter(range(indptr[start], indptr[start + 1]))]
+
+            while stack and len(all_paths) < max_paths:
+                for i in stack[-1]:
+                    neighbor = indices[i]
+                    if neighbor == end:
+                        all_paths.append([vertices[j] for j in path] + [end_vertex])
+                        if len(all_paths) >= max_paths:
+                            break
+                    elif not visited[neighbor]:
+                        visited[neighbor] = 1
+                        path.append(neighbor)
+                        stack.append(iter(range(indptr[neighbor], indptr[neighbor + 1])))
+                        break
+                else:
+                    # Backtrack: unwind this vertex from the current path
+                    stack.pop()
+                    visited[path.pop()] = 0
 
         if verbose:
             print("\n" + "="*60)
@@ -279,6 +373,81 @@ class GraphTraversal:
 
         return all_paths
 
+    @staticmethod
+    def _bfs_csr(indptr, indices, source):
+        """
+        Breadth-first reachability over a CSR snapshot (see graph.to_csr()).
+        Operates purely on integer vertex ids; neighbor iteration is a
+        contiguous array slice instead of per-vertex get_neighbors calls.
+
+        Args:
+            indptr: CSR row-pointer array
+            indices: CSR neighbor-index array
+            source: Integer id of the start vertex
+
+        Returns:
+            list: Integer ids of reached vertices in BFS order
+        """
+        n = len(indptr) - 1
+        # One byte per vertex; indexing a bytearray is a plain load with
+        # no hashing, unlike a set of vertex ids
+        visited = bytearray(n)
+        visited[source] = 1
+        order = [source]
+        queue = deque([source])
+
+        # Bind hot names to locals; the loop below runs once per edge
+        popleft = queue.popleft
+        push = queue.append
+        record = order.append
+
+        while queue:
+            vertex = popleft()
+            for i in range(indptr[vertex], indptr[vertex + 1]):
+                neighbor = indices[i]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    record(neighbor)
+                    push(neighbor)
+
+        return order
+
+    @staticmethod
+    def _dfs_csr(indptr, indices, source):
+        """
+        Depth-first reachability over a CSR snapshot (see graph.to_csr()).
+        Iterative stack variant of _bfs_csr; visits the same vertex set,
+        just in depth-first order.
+
+        Args:
+            indptr: CSR row-pointer array
+            indices: CSR neighbor-index array
+            source: Integer id of the start vertex
+
+        Returns:
+            list: Integer ids of reached vertices in DFS order
+        """
+        n = len(indptr) - 1
+        visited = bytearray(n)
+        order = []
+        stack = [source]
+
+        pop = stack.pop
+        push = stack.append
+        record = order.append
+
+        while stack:
+            vertex = pop()
+            if not visited[vertex]:
+                visited[vertex] = 1
+                record(vertex)
+                for i in range(indptr[vertex], indptr[vertex + 1]):
+                    neighbor = indices[i]
+                    if not visited[neighbor]:
+                        push(neighbor)
+
+        return order
+
     @staticmethod
     def is_connected(graph, verbose=True):
         """
@@ -292,20 +461,20 @@ class GraphTraversal:
         Returns:
             bool: True if graph is connected
         """
-        vertices = graph.get_vertices()
+        vertices, indptr, indices, _ = graph.to_csr()
         if not vertices:
             return True
 
-        # Start DFS from first vertex
-        visited = GraphTraversal.depth_first_search(graph, vertices[0], verbose=False)
+        # BFS over the CSR snapshot from the first vertex
+        reached = GraphTraversal._bfs_csr(indptr, indices, 0)
 
-        is_connected = len(visited) == len(vertices)
+        is_connected = len(reached) == len(vertices)
 
         if verbose:
             print(f"\nGraph connectivity: {'Connected' if is_connected else 'Disconnected'}")
-            print(f"Reachable vertices: {len(visited)} / {len(vertices)}")
+            print(f"Reachable vertices: {len(reached)} / {len(vertices)}")
             if not is_connected:
-                unreachable = set(vertices) - set(visited)
+                unreachable = set(vertices) - {vertices[i] for i in reached}
                 print(f"Unreachable vertices: {unreachable}")
 
         return is_connected
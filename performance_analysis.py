@@ -3,11 +3,45 @@ Performance analysis and comparison between different graph representations.
 """
 
 import time
+import timeit
 import random
+from bisect import bisect_right
 from graph_adjacency_matrix import GraphAdjacencyMatrix
 from graph_adjacency_list import GraphAdjacencyList
 
 
+def _bench_add_vertices(graph, vertices):
+    """
+    Benchmark body: add every vertex in the batch.
+
+    Module-level rather than a lambda so the timed loop accesses its
+    variables via LOAD_FAST instead of closure cells, and the bound
+    method is looked up once outside the loop.
+    """
+    add = graph.add_vertex
+    for vertex in vertices:
+        add(vertex)
+
+
+def _bench_add_edges(graph, edges):
+    """Benchmark body: add every edge in the batch via the bulk API."""
+    graph.add_edges(edges)
+
+
+def _bench_has_edge(graph, probes):
+    """Benchmark body: run every edge-existence probe in the batch."""
+    has_edge = graph.has_edge
+    for u, v in probes:
+        has_edge(u, v)
+
+
+def _bench_get_neighbors(graph, vertices):
+    """Benchmark body: fetch the neighbor list of every vertex."""
+    get_neighbors = graph.get_neighbors
+    for vertex in vertices:
+        get_neighbors(vertex)
+
+
 class PerformanceAnalysis:
     """
     Tools for analyzing and comparing performance of different graph representations.
@@ -15,12 +49,82 @@ class PerformanceAnalysis:
 
     @staticmethod
     def measure_time(func, *args, **kwargs):
-        """Measure execution time of a function."""
+        """
+        Measure the average execution time of a function.
+
+        Uses timeit.Timer.autorange, which repeats the call until at
+        least ~0.2 s of wall time has accumulated and reports the mean
+        per loop; a single timed call of a sub-millisecond workload is
+        mostly clock jitter. The function's return value is discarded;
+        use measure_once when it is needed.
+
+        Returns:
+            tuple: (None, seconds per call)
+        """
+        timer = timeit.Timer(lambda: func(*args, **kwargs))
+        loops, total = timer.autorange()
+        return None, total / loops
+
+    @staticmethod
+    def measure_once(func, *args, **kwargs):
+        """
+        Measure a single execution of a function and keep its result.
+
+        Returns:
+            tuple: (result, elapsed seconds)
+        """
         start = time.perf_counter()
         result = func(*args, **kwargs)
         end = time.perf_counter()
         return result, end - start
 
+    @staticmethod
+    def _sample_edges(num_vertices, num_edges, weighted, directed):
+        """
+        Sample distinct random edges without rejection.
+
+        Instead of drawing endpoint pairs and retrying on duplicates
+        (which degrades badly as the graph fills up), enumerate the
+        space of valid vertex pairs by index, draw num_edges distinct
+        indices with random.sample, and decode each index back to a
+        pair. Every draw is useful, so the cost is O(num_edges) instead
+        of an unbounded rejection loop.
+
+        Args:
+            num_vertices: Number of vertices (labels 0..num_vertices-1)
+            num_edges: Number of distinct edges to sample
+            weighted: Whether to attach random weights in [1, 100]
+            directed: Whether (u, v) and (v, u) are distinct edges
+
+        Returns:
+            list: List of (u, v, weight) tuples
+        """
+        if directed:
+            # Ordered pairs without self-loops: n*(n-1) of them
+            space = num_vertices * (num_vertices - 1)
+        else:
+            # Unordered pairs u < v: n*(n-1)/2 of them
+            space = num_vertices * (num_vertices - 1) // 2
+        num_edges = min(num_edges, space)
+
+        if not directed:
+            # offsets[u] = index of pair (u, u+1); rows shrink as u grows
+            offsets = [u * num_vertices - u * (u + 1) // 2
+                       for u in range(num_vertices - 1)]
+
+        edges = []
+        for k in random.sample(range(space), num_edges):
+            if directed:
+                u, r = divmod(k, num_vertices - 1)
+                v = r if r < u else r + 1
+            else:
+                u = bisect_right(offsets, k) - 1
+                v = u + 1 + (k - offsets[u])
+            weight = random.randint(1, 100) if weighted else 1
+            edges.append((u, v, weight))
+
+        return edges
+
     @staticmethod
     def compare_representations(num_vertices=100, num_edges=500, weighted=True, directed=False):
         """
@@ -53,12 +157,12 @@ class PerformanceAnalysis:
         vertices = [i for i in range(num_vertices)]
 
         _, matrix_time = PerformanceAnalysis.measure_time(
-            lambda: [matrix_graph.add_vertex(v) for v in vertices]
+            _bench_add_vertices, matrix_graph, vertices
         )
         print(f"Adjacency Matrix: {matrix_time*1000:.4f} ms")
 
         _, list_time = PerformanceAnalysis.measure_time(
-            lambda: [list_graph.add_vertex(v) for v in vertices]
+            _bench_add_vertices, list_graph, vertices
         )
         print(f"Adjacency List:   {list_time*1000:.4f} ms")
 
@@ -69,26 +173,17 @@ class PerformanceAnalysis:
         print("\n2. ADDING EDGES")
         print("-"*80)
 
-        # Generate random edges
-        edges = []
-        edge_set = set()
-        while len(edges) < num_edges:
-            u = random.randint(0, num_vertices - 1)
-            v = random.randint(0, num_vertices - 1)
-            if u != v and (u, v) not in edge_set:
-                weight = random.randint(1, 100) if weighted else 1
-                edges.append((u, v, weight))
-                edge_set.add((u, v))
-                if not directed:
-                    edge_set.add((v, u))
+        # Generate distinct random edges in one rejection-free pass
+        edges = PerformanceAnalysis._sample_edges(num_vertices, num_edges,
+                                                  weighted, directed)
 
         _, matrix_time = PerformanceAnalysis.measure_time(
-            lambda: [matrix_graph.add_edge(u, v, w) for u, v, w in edges]
+            _bench_add_edges, matrix_graph, edges
         )
         print(f"Adjacency Matrix: {matrix_time*1000:.4f} ms")
 
         _, list_time = PerformanceAnalysis.measure_time(
-            lambda: [list_graph.add_edge(u, v, w) for u, v, w in edges]
+            _bench_add_edges, list_graph, edges
         )
         print(f"Adjacency List:   {list_time*1000:.4f} ms")
 
@@ -99,20 +194,23 @@ class PerformanceAnalysis:
             print(f"Matrix is {1/speedup:.2f}x faster")
 
         # Test 3: Checking edges
-        print("\n3. CHECKING EDGE EXISTENCE (1000 random checks)")
+        # Dedupe the probe pairs so both graphs are timed on unique
+        # lookups only; repeated (u, v) draws would just re-measure the
+        # same bucket scan and skew the comparison for small graphs
+        test_edges = list({(random.randint(0, num_vertices - 1),
+                            random.randint(0, num_vertices - 1))
+                           for _ in range(1000)})
+
+        print(f"\n3. CHECKING EDGE EXISTENCE ({len(test_edges)} unique random checks)")
         print("-"*80)
 
-        test_edges = [(random.randint(0, num_vertices - 1),
-                      random.randint(0, num_vertices - 1))
-                     for _ in range(1000)]
-
         _, matrix_time = PerformanceAnalysis.measure_time(
-            lambda: [matrix_graph.has_edge(u, v) for u, v in test_edges]
+            _bench_has_edge, matrix_graph, test_edges
         )
         print(f"Adjacency Matrix: {matrix_time*1000:.4f} ms")
 
         _, list_time = PerformanceAnalysis.measure_time(
-            lambda: [list_graph.has_edge(u, v) for u, v in test_edges]
+            _bench_has_edge, list_graph, test_edges
         )
         print(f"Adjacency List:   {list_time*1000:.4f} ms")
 
@@ -127,12 +225,12 @@ class PerformanceAnalysis:
         print("-"*80)
 
         _, matrix_time = PerformanceAnalysis.measure_time(
-            lambda: [matrix_graph.get_neighbors(v) for v in vertices]
+            _bench_get_neighbors, matrix_graph, vertices
         )
         print(f"Adjacency Matrix: {matrix_time*1000:.4f} ms")
 
         _, list_time = PerformanceAnalysis.measure_time(
-            lambda: [list_graph.get_neighbors(v) for v in vertices]
+            _bench_get_neighbors, list_graph, vertices
         )
         print(f"Adjacency List:   {list_time*1000:.4f} ms")
 
@@ -214,24 +312,31 @@ class PerformanceAnalysis:
         density = num_edges / max_edges if max_edges > 0 else 0
         print(f"Density: {density*100:.2f}%")
 
-        # Calculate degree statistics
-        degrees = []
-        for vertex in vertices:
-            degree = len(graph.get_neighbors(vertex))
-            degrees.append(degree)
-
-        if degrees:
-            avg_degree = sum(degrees) / len(degrees)
-            max_degree = max(degrees)
-            min_degree = min(degrees)
+        # Collect all degree statistics in a single pass over the
+        # vertices: sum, max, min and the max-degree vertices together,
+        # instead of separate sum()/max()/min() sweeps plus a final
+        # comprehension over the degree list
+        if num_vertices > 0:
+            total_degree = 0
+            max_degree = -1
+            min_degree = None
+            max_degree_vertices = []
+
+            for vertex in vertices:
+                degree = graph.get_degree(vertex)
+                total_degree += degree
+                if degree > max_degree:
+                    max_degree = degree
+                    max_degree_vertices = [vertex]
+                elif degree == max_degree:
+                    max_degree_vertices.append(vertex)
+                if min_degree is None or degree < min_degree:
+                    min_degree = degree
 
             print(f"\nDegree Statistics:")
-            print(f"  Average: {avg_degree:.2f}")
+            print(f"  Average: {total_degree / num_vertices:.2f}")
             print(f"  Maximum: {max_degree}")
             print(f"  Minimum: {min_degree}")
-
-            # Find vertices with max degree
-            max_degree_vertices = [vertices[i] for i, d in enumerate(degrees) if d == max_degree]
             print(f"  Highest degree vertices: {max_degree_vertices[:5]}")
 
         # Classify graph
@@ -4,14 +4,54 @@ Implements Dijkstra's algorithm and Bellman-Ford algorithm.
 """
 
 import heapq
+import math
+import weakref
+from array import array
 from collections import deque
 
+# Unreached-distance sentinel: math.inf is a singleton, so reusing it
+# avoids the float constructor's parsing path inside tight loops
+_INF = math.inf
+
+# Memoized single-source Dijkstra results keyed by (graph id, source),
+# validated against a weakref to the graph and its _version mutation
+# counter. The version makes entries for a changed graph miss; the
+# weakref guards against a freed graph's id being recycled
+_SSSP_CACHE = {}
+_SSSP_CACHE_MAX = 32
+
+
+def _unbox(value):
+    """
+    Convert an integral float back to a clean Python int.
+    Distances accumulate in arrays of doubles, so integer edge weights
+    come back as floats (4.0); convert those for display/API parity.
+    """
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
 
 class ShortestPath:
     """
     Collection of shortest path algorithms.
     """
 
+    @staticmethod
+    def _index_vertices(graph):
+        """
+        Map vertices to contiguous integer indices.
+
+        Args:
+            graph: Graph object
+
+        Returns:
+            tuple: (vertex_list, index_map) where vertex_list[i] is the
+                   label of vertex i and index_map inverts it
+        """
+        vertices = graph.get_vertices()
+        return vertices, {v: i for i, v in enumerate(vertices)}
+
     @staticmethod
     def dijkstra(graph, start_vertex, end_vertex=None, verbose=True):
         """
@@ -31,97 +71,372 @@ class ShortestPath:
             tuple: (distances dict, predecessors dict) where distances[v] is the shortest
                    distance from start to v, and predecessors[v] is the previous vertex
         """
-        if start_vertex not in graph.get_vertices():
+        if not graph.has_vertex(start_vertex):
             if verbose:
                 print(f"Error: Start vertex '{start_vertex}' not in graph")
             return {}, {}
 
-        # Initialize distances and predecessors
-        distances = {v: float('inf') for v in graph.get_vertices()}
-        predecessors = {v: None for v in graph.get_vertices()}
-        distances[start_vertex] = 0
-
-        # Priority queue: (distance, vertex)
-        pq = [(0, start_vertex)]
-        visited = set()
+        # Without tracing there is nothing to print per step, so run the
+        # CSR kernel instead; it produces identical results. Everything
+        # below this point is the traced path and prints unconditionally,
+        # so no per-step verbose checks are needed.
+        if not verbose:
+            return ShortestPath.dijkstra_fast(graph, start_vertex, end_vertex)
+
+        # Work on contiguous integer indices internally: distances live in
+        # a flat array of doubles and predecessors in a flat array of ints
+        # (-1 = none), so each relaxation is an array load/store instead of
+        # a dict probe on a boxed label
+        vertices, index_map = ShortestPath._index_vertices(graph)
+        n = len(vertices)
+        dist = array('d', [_INF]) * n
+        pred = array('l', [-1]) * n
+
+        start_idx = index_map[start_vertex]
+        end_idx = index_map.get(end_vertex, -1) if end_vertex is not None else -1
+        dist[start_idx] = 0
+
+        # Priority queue: (distance, version, vertex index). Each push is
+        # tagged with the vertex's current version; re-relaxing a vertex
+        # bumps its version, so older heap entries are recognized as stale
+        # on pop and skipped without any visited-set hashing
+        version = array('l', [0]) * n
+        pq = [(0, 0, start_idx)]
         step = 0
 
-        if verbose:
-            print("\n" + "="*70)
-            print("DIJKSTRA'S SHORTEST PATH ALGORITHM")
-            print("="*70)
-            print(f"Starting vertex: {start_vertex}")
-            if end_vertex:
-                print(f"Target vertex: {end_vertex}")
-            print("-"*70)
+        print("\n" + "="*70)
+        print("DIJKSTRA'S SHORTEST PATH ALGORITHM")
+        print("="*70)
+        print(f"Starting vertex: {start_vertex}")
+        if end_vertex:
+            print(f"Target vertex: {end_vertex}")
+        print("-"*70)
 
         while pq:
-            current_distance, current_vertex = heapq.heappop(pq)
+            current_distance, ver, current_idx = heapq.heappop(pq)
 
-            # Skip if already visited
-            if current_vertex in visited:
+            # Skip stale entries superseded by a later relaxation
+            if ver != version[current_idx]:
                 continue
 
-            visited.add(current_vertex)
             step += 1
 
-            if verbose:
-                print(f"\nStep {step}: Processing vertex {current_vertex}")
-                print(f"  Current distance: {current_distance}")
+            print(f"\nStep {step}: Processing vertex {vertices[current_idx]}")
+            print(f"  Current distance: {_unbox(current_distance)}")
 
             # If we reached the target, we can stop (optional optimization)
-            if end_vertex and current_vertex == end_vertex:
-                if verbose:
-                    print(f"  Reached target vertex!")
+            if current_idx == end_idx and end_idx >= 0:
+                print(f"  Reached target vertex!")
                 break
 
-            # Check all neighbors
-            neighbors = graph.get_neighbors(current_vertex)
-            if verbose and neighbors:
-                print(f"  Neighbors: {[(n, w) for n, w in neighbors]}")
+            # Check all neighbors (parallel label/weight sequences, so the
+            # loop indexes instead of unpacking a tuple per edge)
+            neighbor_labels, neighbor_weights = graph.get_neighbors_arrays(
+                vertices[current_idx])
+            if neighbor_labels:
+                print(f"  Neighbors: {list(zip(neighbor_labels, neighbor_weights))}")
 
-            for neighbor, weight in neighbors:
-                if neighbor in visited:
-                    continue
+            for i in range(len(neighbor_labels)):
+                neighbor = neighbor_labels[i]
+                weight = neighbor_weights[i]
+                ni = index_map[neighbor]
 
                 # Calculate new distance
                 new_distance = current_distance + weight
 
                 # If new distance is shorter, update
-                if new_distance < distances[neighbor]:
-                    old_distance = distances[neighbor]
-                    distances[neighbor] = new_distance
-                    predecessors[neighbor] = current_vertex
-                    heapq.heappush(pq, (new_distance, neighbor))
+                if new_distance < dist[ni]:
+                    old_distance = dist[ni]
+                    dist[ni] = new_distance
+                    pred[ni] = current_idx
+                    version[ni] += 1
+                    heapq.heappush(pq, (new_distance, version[ni], ni))
+
+                    print(f"    {neighbor}: {_unbox(old_distance)} -> "
+                          f"{_unbox(new_distance)} (via {vertices[current_idx]})")
+
+        # Convert the flat arrays back to the documented dict-based API
+        distances = {v: _unbox(dist[i]) for i, v in enumerate(vertices)}
+        predecessors = {v: (vertices[pred[i]] if pred[i] >= 0 else None)
+                        for i, v in enumerate(vertices)}
+
+        print("\n" + "-"*70)
+        print("RESULTS:")
+        print("-"*70)
+
+        # Sort vertices for consistent display. sorted() evaluates the
+        # key once per element (decorate-sort-undecorate), so str runs
+        # O(V) times here, not once per comparison
+        sorted_vertices = sorted((v for v in vertices if v != start_vertex),
+                                 key=str)
+
+        print(f"{'Vertex':<15} {'Distance':<15} {'Path':<30}")
+        print("-"*70)
+
+        for vertex in [start_vertex] + sorted_vertices:
+            if distances[vertex] == _INF:
+                print(f"{str(vertex):<15} {'∞':<15} {'No path':<30}")
+            else:
+                path = ShortestPath._reconstruct_path(predecessors, start_vertex, vertex)
+                path_str = ' -> '.join(map(str, path))
+                print(f"{str(vertex):<15} {distances[vertex]:<15} {path_str:<30}")
+
+        print("="*70 + "\n")
 
-                    if verbose:
-                        print(f"    {neighbor}: {old_distance} -> {new_distance} "
-                              f"(via {current_vertex})")
+        return distances, predecessors
 
-        if verbose:
-            print("\n" + "-"*70)
-            print("RESULTS:")
-            print("-"*70)
+    @staticmethod
+    def _dijkstra_csr(indptr, indices, data, start, end=-1):
+        """
+        Dijkstra kernel over a CSR snapshot (see graph.to_csr()).
 
-            # Sort vertices for consistent display
-            sorted_vertices = sorted([v for v in graph.get_vertices() if v != start_vertex],
-                                   key=str)
+        Operates purely on integer vertex ids with flat distance and
+        predecessor arrays; neighbor iteration is a contiguous array
+        slice and stale heap entries are discarded by comparing the
+        popped distance against the current best (lazy deletion).
 
-            print(f"{'Vertex':<15} {'Distance':<15} {'Path':<30}")
-            print("-"*70)
+        When every weight is integral (and the graph is small enough to
+        index in 24 bits), each heap entry is a single int packing
+        (distance << 24) | vertex, so the heap holds unboxed ints that
+        order exactly like (distance, vertex) tuples without allocating
+        a tuple per relaxation. Float weights fall back to tuples.
 
-            for vertex in [start_vertex] + sorted_vertices:
-                if distances[vertex] == float('inf'):
-                    print(f"{str(vertex):<15} {'∞':<15} {'No path':<30}")
-                else:
-                    path = ShortestPath._reconstruct_path(predecessors, start_vertex, vertex)
-                    path_str = ' -> '.join(map(str, path))
-                    print(f"{str(vertex):<15} {distances[vertex]:<15} {path_str:<30}")
+        Args:
+            indptr: CSR row-pointer array
+            indices: CSR neighbor-index array
+            data: CSR edge-weight array
+            start: Integer id of the start vertex
+            end: Integer id of the target vertex, or -1 for all targets
 
-            print("="*70 + "\n")
+        Returns:
+            tuple: (dist, pred) flat arrays indexed by vertex id
+        """
+        n = len(indptr) - 1
+        dist = array('d', [_INF]) * n
+        pred = array('l', [-1]) * n
+        dist[start] = 0
+
+        push = heapq.heappush
+        pop = heapq.heappop
+
+        packed = n < (1 << 24)
+        if packed:
+            for w in data:
+                if not w.is_integer():
+                    packed = False
+                    break
+
+        # One byte per vertex marks settled vertices; indexing a bytearray
+        # returns a small int directly, where re-reading dist[u] would box
+        # a fresh float on every popped entry
+        settled = bytearray(n)
+
+        if packed:
+            weights = array('l', (int(w) for w in data))
+            mask = (1 << 24) - 1
+            pq = [start]  # (0 << 24) | start
+
+            while pq:
+                key = pop(pq)
+                u = key & mask
+
+                # Stale entry: u was already settled at its minimal distance
+                if settled[u]:
+                    continue
+                settled[u] = 1
+                current_distance = key >> 24
+
+                if u == end:
+                    break
+
+                for i in range(indptr[u], indptr[u + 1]):
+                    v = indices[i]
+                    new_distance = current_distance + weights[i]
+                    if new_distance < dist[v]:
+                        dist[v] = new_distance
+                        pred[v] = u
+                        push(pq, (new_distance << 24) | v)
+
+            return dist, pred
+
+        pq = [(0, start)]
+
+        while pq:
+            current_distance, u = pop(pq)
+
+            # Stale entry: u was already settled at its minimal distance
+            if settled[u]:
+                continue
+            settled[u] = 1
+
+            if u == end:
+                break
+
+            for i in range(indptr[u], indptr[u + 1]):
+                v = indices[i]
+                new_distance = current_distance + data[i]
+                if new_distance < dist[v]:
+                    dist[v] = new_distance
+                    pred[v] = u
+                    push(pq, (new_distance, v))
+
+        return dist, pred
+
+    @staticmethod
+    def dijkstra_fast(graph, start_vertex, end_vertex=None):
+        """
+        Non-verbose Dijkstra via the CSR kernel.
+
+        Builds a CSR snapshot once, runs _dijkstra_csr on integer ids,
+        and converts the flat result arrays back to the dict-based API
+        of dijkstra(). Use this on hot paths where step-by-step tracing
+        is not needed.
+
+        Args:
+            graph: Graph object
+            start_vertex: Starting vertex
+            end_vertex: Optional ending vertex (if None, finds paths to
+                        all vertices)
 
+        Returns:
+            tuple: (distances dict, predecessors dict)
+        """
+        if not graph.has_vertex(start_vertex):
+            return {}, {}
+
+        vertices, indptr, indices, data = graph.to_csr()
+        index_map = {v: i for i, v in enumerate(vertices)}
+        end_idx = index_map.get(end_vertex, -1) if end_vertex is not None else -1
+
+        dist, pred = ShortestPath._dijkstra_csr(indptr, indices, data,
+                                                index_map[start_vertex], end_idx)
+
+        distances = {v: _unbox(dist[i]) for i, v in enumerate(vertices)}
+        predecessors = {v: (vertices[pred[i]] if pred[i] >= 0 else None)
+                        for i, v in enumerate(vertices)}
         return distances, predecessors
 
+    @staticmethod
+    def dijkstra_cached(graph, start_vertex):
+        """
+        Single-source Dijkstra with memoized results.
+
+        Computes the full (distances, predecessors) pair once per
+        (graph, source); repeat queries for other destinations from the
+        same source on an unmutated graph are dictionary hits instead
+        of reruns of the kernel. Entries are keyed on the graph's
+        _version mutation counter, so adding or removing anything
+        invalidates them automatically. The cache holds the last
+        _SSSP_CACHE_MAX results, evicting oldest-first.
+
+        Args:
+            graph: Graph object
+            start_vertex: Starting vertex
+
+        Returns:
+            tuple: (distances dict, predecessors dict)
+        """
+        key = (id(graph), start_vertex)
+        entry = _SSSP_CACHE.get(key)
+        if entry is not None:
+            ref, version, result = entry
+            if ref() is graph and version == graph._version:
+                return result
+
+        result = ShortestPath.dijkstra_fast(graph, start_vertex)
+        if len(_SSSP_CACHE) >= _SSSP_CACHE_MAX:
+            _SSSP_CACHE.pop(next(iter(_SSSP_CACHE)))
+        _SSSP_CACHE[key] = (weakref.ref(graph), graph._version, result)
+        return result
+
+    @staticmethod
+    def k_shortest_paths(graph, start_vertex, end_vertex, k=3):
+        """
+        Find up to k cheapest loop-free paths between two vertices.
+
+        Best-first search over partial paths on a CSR snapshot: a heap
+        of (cost, path) entries is expanded cheapest-first, so complete
+        paths pop in non-decreasing cost order and the search stops as
+        soon as the k-th one appears. Unlike a DFS enumeration that
+        collects everything and truncates, work is bounded by capping
+        expansions per vertex at k.
+
+        Time Complexity: O(k * E * log(k * E))
+
+        Args:
+            graph: Graph object
+            start_vertex: Starting vertex
+            end_vertex: Ending vertex
+            k: Maximum number of paths to return
+
+        Returns:
+            list: Up to k (path, cost) tuples ordered from cheapest,
+                  where path is a list of vertex labels
+        """
+        if not graph.has_vertex(start_vertex) or not graph.has_vertex(end_vertex):
+            return []
+
+        vertices, indptr, indices, data = graph.to_csr()
+        index = {v: i for i, v in enumerate(vertices)}
+        start = index[start_vertex]
+        end = index[end_vertex]
+
+        results = []
+        expansions = [0] * len(vertices)
+        counter = 0  # Tie-breaker so the heap never compares paths
+        heap = [(0.0, 0, (start,))]
+
+        while heap and len(results) < k:
+            cost, _, path = heapq.heappop(heap)
+            u = path[-1]
+
+            if u == end:
+                results.append(([vertices[i] for i in path], _unbox(cost)))
+                continue
+
+            if expansions[u] >= k:
+                continue
+            expansions[u] += 1
+
+            for p in range(indptr[u], indptr[u + 1]):
+                v = indices[p]
+                if v in path:  # Keep paths loop-free
+                    continue
+                counter += 1
+                heapq.heappush(heap, (cost + data[p], counter, path + (v,)))
+
+        return results
+
+    @staticmethod
+    def path_weight_csr(indptr, indices, data, path_idx):
+        """
+        Sum the edge weights along a path of CSR vertex indices.
+
+        Works on a prebuilt to_csr() snapshot so callers scoring many
+        candidate paths on the same graph pay the snapshot cost once
+        and run each summation over flat arrays, with no per-hop
+        get_edge_weight dict/attribute lookups.
+
+        Args:
+            indptr, indices, data: CSR arrays from to_csr()
+            path_idx: Sequence of vertex indices describing the path
+
+        Returns:
+            Total weight of the path (ints stay ints), or None if some
+            hop has no edge
+        """
+        total = 0.0
+        for k in range(len(path_idx) - 1):
+            u = path_idx[k]
+            v = path_idx[k + 1]
+            for p in range(indptr[u], indptr[u + 1]):
+                if indices[p] == v:
+                    total += data[p]
+                    break
+            else:
+                return None
+        return _unbox(total)
+
     @staticmethod
     def bellman_ford(graph, start_vertex, verbose=True):
         """
@@ -139,13 +454,13 @@ class ShortestPath:
         Returns:
             tuple: (distances dict, predecessors dict, has_negative_cycle bool)
         """
-        if start_vertex not in graph.get_vertices():
+        if not graph.has_vertex(start_vertex):
             if verbose:
                 print(f"Error: Start vertex '{start_vertex}' not in graph")
             return {}, {}, False
 
         vertices = graph.get_vertices()
-        distances = {v: float('inf') for v in vertices}
+        distances = dict.fromkeys(vertices, _INF)
         predecessors = {v: None for v in vertices}
         distances[start_vertex] = 0
 
@@ -157,54 +472,74 @@ class ShortestPath:
             print(f"Number of vertices: {len(vertices)}")
             print("-"*70)
 
-        # Relax edges V-1 times
-        for iteration in range(len(vertices) - 1):
-            updated = False
+        # Relax edges up to V-1 times, but only rescan vertices whose
+        # distance changed in the previous round (SPFA-style frontier).
+        # Vertices that were not updated cannot improve their neighbors,
+        # so skipping them turns each round from O(E) into work that is
+        # proportional to the active frontier. A dict keeps the frontier
+        # in deterministic insertion order.
+        #
+        # Round V doubles as the negative-cycle check: after V-1 rounds
+        # distances are final unless a negative cycle exists, so any
+        # further improvement proves one without a separate edge sweep.
+        has_negative_cycle = False
+        active = {start_vertex: None}
+        num_rounds = len(vertices)
 
-            if verbose:
-                print(f"\nIteration {iteration + 1}:")
+        # Tracing callable built once; the relaxation loop tests a single
+        # local instead of re-checking verbose at every print site
+        trace_update = None
+        if verbose:
+            def trace_update(vertex, neighbor, new_distance):
+                print(f"  {vertex} -> {neighbor}: Update distance to {new_distance}")
 
-            for vertex in vertices:
-                if distances[vertex] == float('inf'):
-                    continue
+        for iteration in range(num_rounds):
+            final_pass = iteration == num_rounds - 1
 
-                neighbors = graph.get_neighbors(vertex)
-                for neighbor, weight in neighbors:
+            if verbose:
+                if final_pass:
+                    print("\nChecking for negative cycles...")
+                else:
+                    print(f"\nIteration {iteration + 1}:")
+
+            new_active = {}
+            for vertex in active:
+                neighbor_labels, neighbor_weights = graph.get_neighbors_arrays(vertex)
+                for i in range(len(neighbor_labels)):
+                    neighbor = neighbor_labels[i]
+                    weight = neighbor_weights[i]
                     new_distance = distances[vertex] + weight
 
                     if new_distance < distances[neighbor]:
+                        if final_pass:
+                            has_negative_cycle = True
+                            if verbose:
+                                print(f"  Negative cycle detected involving edge "
+                                      f"{vertex} -> {neighbor}")
+                            break
+
                         distances[neighbor] = new_distance
                         predecessors[neighbor] = vertex
-                        updated = True
-
-                        if verbose:
-                            print(f"  {vertex} -> {neighbor}: Update distance to {new_distance}")
-
-            if not updated:
-                if verbose:
-                    print("  No updates made. Algorithm complete.")
-                break
-
-        # Check for negative cycles
-        has_negative_cycle = False
-        if verbose:
-            print("\nChecking for negative cycles...")
+                        new_active[neighbor] = None
 
-        for vertex in vertices:
-            if distances[vertex] == float('inf'):
-                continue
+                        if trace_update is not None:
+                            trace_update(vertex, neighbor, new_distance)
 
-            neighbors = graph.get_neighbors(vertex)
-            for neighbor, weight in neighbors:
-                if distances[vertex] + weight < distances[neighbor]:
-                    has_negative_cycle = True
-                    if verbose:
-                        print(f"  Negative cycle detected involving edge {vertex} -> {neighbor}")
+                if has_negative_cycle:
                     break
 
             if has_negative_cycle:
                 break
 
+            active = new_active
+            if not active:
+                # Stabilized early: no further update is possible, which
+                # also rules out a reachable negative cycle
+                if verbose:
+                    print("  No updates made. Algorithm complete.")
+                    print("\nChecking for negative cycles...")
+                break
+
         if not has_negative_cycle and verbose:
             print("  No negative cycles detected.")
 
@@ -213,13 +548,13 @@ class ShortestPath:
             print("RESULTS:")
             print("-"*70)
 
-            sorted_vertices = sorted([v for v in vertices if v != start_vertex], key=str)
+            sorted_vertices = sorted((v for v in vertices if v != start_vertex), key=str)
 
             print(f"{'Vertex':<15} {'Distance':<15} {'Path':<30}")
             print("-"*70)
 
             for vertex in [start_vertex] + sorted_vertices:
-                if distances[vertex] == float('inf'):
+                if distances[vertex] == _INF:
                     print(f"{str(vertex):<15} {'∞':<15} {'No path':<30}")
                 else:
                     path = ShortestPath._reconstruct_path(predecessors, start_vertex, vertex)
@@ -247,14 +582,18 @@ class ShortestPath:
         Returns:
             list: Shortest path from start to end, or empty list if no path exists
         """
-        if start_vertex not in graph.get_vertices() or end_vertex not in graph.get_vertices():
+        if not graph.has_vertex(start_vertex) or not graph.has_vertex(end_vertex):
             return []
 
         if start_vertex == end_vertex:
             return [start_vertex]
 
+        # Store only vertices in the queue and record each vertex's
+        # predecessor; the path is rebuilt once at the end instead of
+        # being copied in full on every enqueue
         visited = {start_vertex}
-        queue = deque([(start_vertex, [start_vertex])])
+        predecessors = {start_vertex: None}
+        queue = deque([start_vertex])
         step = 0
 
         if verbose:
@@ -265,16 +604,19 @@ class ShortestPath:
             print("-"*60)
 
         while queue:
-            vertex, path = queue.popleft()
+            vertex = queue.popleft()
             step += 1
 
             if verbose:
+                path = ShortestPath._reconstruct_path(predecessors, start_vertex, vertex)
                 print(f"Step {step}: Exploring {vertex}, Path: {' -> '.join(map(str, path))}")
 
             neighbors = graph.get_neighbors(vertex)
             for neighbor, weight in neighbors:
                 if neighbor == end_vertex:
-                    final_path = path + [neighbor]
+                    predecessors[neighbor] = vertex
+                    final_path = ShortestPath._reconstruct_path(predecessors,
+                                                                start_vertex, end_vertex)
                     if verbose:
                         print(f"\nFound shortest path!")
                         print(f"Path: {' -> '.join(map(str, final_path))}")
@@ -284,7 +626,8 @@ class ShortestPath:
 
                 if neighbor not in visited:
                     visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
+                    predecessors[neighbor] = vertex
+                    queue.append(neighbor)
 
         if verbose:
             print(f"\nNo path found from {start_vertex} to {end_vertex}")
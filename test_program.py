@@ -10,13 +10,25 @@ This program demonstrates:
 6. Visual representations of graphs and algorithm execution
 """
 
-from graph_adjacency_matrix import GraphAdjacencyMatrix
+import io
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from graph import best_representation
 from graph_adjacency_list import GraphAdjacencyList
 from graph_traversal import GraphTraversal
 from shortest_path import ShortestPath
 from performance_analysis import PerformanceAnalysis
 from visualization import GraphVisualizer
 
+# Demo 3 can additionally run the recursive DFS to compare its order
+# with the iterative one. The orders are identical by construction, so
+# the extra traversal (with its per-vertex call-frame overhead and
+# recursion-limit exposure on deep graphs) is off by default.
+COMPARE_RECURSIVE_DFS = False
+
 
 def demo_basic_operations():
     """Demonstrate basic graph operations."""
@@ -24,20 +36,9 @@ def demo_basic_operations():
     print("# DEMO 1: BASIC GRAPH OPERATIONS")
     print("#"*80)
 
-    # Create graphs with both representations
-    print("\n>>> Creating graphs with both representations...")
-    matrix_graph = GraphAdjacencyMatrix(directed=False, weighted=True)
-    list_graph = GraphAdjacencyList(directed=False, weighted=True)
-
-    # Add vertices
-    print("\n>>> Adding vertices: A, B, C, D, E")
+    # Pick one representation by expected density instead of building
+    # (and then mostly ignoring) both
     vertices = ['A', 'B', 'C', 'D', 'E']
-    for v in vertices:
-        matrix_graph.add_vertex(v)
-        list_graph.add_vertex(v)
-
-    # Add edges
-    print(">>> Adding edges with weights")
     edges = [
         ('A', 'B', 4),
         ('A', 'C', 2),
@@ -48,25 +49,30 @@ def demo_basic_operations():
         ('D', 'E', 2)
     ]
 
+    print("\n>>> Choosing representation by expected density...")
+    graph = best_representation(len(vertices), len(edges),
+                                directed=False, weighted=True)
+    print(f"   Selected: {type(graph).__name__}")
+
+    # Add vertices and edges through the bulk APIs
+    print("\n>>> Adding vertices: A, B, C, D, E")
+    graph.add_vertices(vertices)
+
+    print(">>> Adding edges with weights")
+    graph.add_edges(edges)
     for u, v, w in edges:
-        matrix_graph.add_edge(u, v, w)
-        list_graph.add_edge(u, v, w)
         print(f"   Added edge: {u} <-> {v} (weight: {w})")
 
-    # Display both representations
-    matrix_graph.display()
-    list_graph.display()
-
-    # Visualize
-    GraphVisualizer.visualize_graph(matrix_graph, "Undirected Weighted Graph")
+    # Visualize (includes the representation's display banner)
+    GraphVisualizer.visualize_graph(graph, "Undirected Weighted Graph")
 
     print("\n>>> Testing edge operations...")
-    print(f"Has edge A-B? {matrix_graph.has_edge('A', 'B')}")
-    print(f"Weight of A-B: {matrix_graph.get_edge_weight('A', 'B')}")
-    print(f"Neighbors of C: {matrix_graph.get_neighbors('C')}")
+    print(f"Has edge A-B? {graph.has_edge('A', 'B')}")
+    print(f"Weight of A-B: {graph.get_edge_weight('A', 'B')}")
+    print(f"Neighbors of C: {graph.get_neighbors('C')}")
 
     # Analyze properties
-    PerformanceAnalysis.analyze_graph_properties(matrix_graph, "Undirected Weighted Graph")
+    PerformanceAnalysis.analyze_graph_properties(graph, "Undirected Weighted Graph")
 
 
 def demo_directed_graph():
@@ -76,12 +82,13 @@ def demo_directed_graph():
     print("#"*80)
 
     print("\n>>> Creating a directed graph (Social Network)")
-    graph = GraphAdjacencyList(directed=True, weighted=False)
+    users = ['Alice', 'Bob', 'Carol', 'David', 'Eve']
+    follows_count = 8
+    graph = best_representation(len(users), follows_count,
+                                directed=True, weighted=False)
 
     # Add users
-    users = ['Alice', 'Bob', 'Carol', 'David', 'Eve']
-    for user in users:
-        graph.add_vertex(user)
+    graph.add_vertices(users)
 
     # Add following relationships
     print("\n>>> Adding following relationships (A -> B means A follows B)")
@@ -96,11 +103,10 @@ def demo_directed_graph():
         ('Eve', 'Alice')
     ]
 
+    graph.add_edges((u, v, 1) for u, v in follows)
     for u, v in follows:
-        graph.add_edge(u, v, 1)
         print(f"   {u} follows {v}")
 
-    graph.display()
     GraphVisualizer.visualize_graph(graph, "Social Network (Directed Graph)")
 
 
@@ -114,9 +120,7 @@ def demo_traversal_algorithms():
     print("\n>>> Creating a graph for traversal demonstration")
     graph = GraphAdjacencyList(directed=False, weighted=False)
 
-    vertices = [1, 2, 3, 4, 5, 6, 7, 8]
-    for v in vertices:
-        graph.add_vertex(v)
+    graph.add_vertices([1, 2, 3, 4, 5, 6, 7, 8])
 
     edges = [
         (1, 2), (1, 3),
@@ -124,11 +128,8 @@ def demo_traversal_algorithms():
         (3, 6), (3, 7),
         (4, 8), (5, 8)
     ]
+    graph.add_edges((u, v, 1) for u, v in edges)
 
-    for u, v in edges:
-        graph.add_edge(u, v, 1)
-
-    graph.display()
     GraphVisualizer.visualize_graph(graph, "Tree-like Graph for Traversal")
 
     # Depth-First Search (Iterative)
@@ -138,11 +139,12 @@ def demo_traversal_algorithms():
     dfs_order = GraphTraversal.depth_first_search(graph, 1, verbose=True)
     GraphVisualizer.visualize_traversal(graph, dfs_order, "DFS (Iterative)", 1)
 
-    # Depth-First Search (Recursive)
-    print("\n" + "="*80)
-    print("DEPTH-FIRST SEARCH (RECURSIVE)")
-    print("="*80)
-    dfs_recursive_order = GraphTraversal.depth_first_search_recursive(graph, 1, verbose=True)
+    # Depth-First Search (Recursive), optional duplicate traversal
+    if COMPARE_RECURSIVE_DFS:
+        print("\n" + "="*80)
+        print("DEPTH-FIRST SEARCH (RECURSIVE)")
+        print("="*80)
+        dfs_recursive_order = GraphTraversal.depth_first_search_recursive(graph, 1, verbose=True)
 
     # Breadth-First Search
     print("\n" + "="*80)
@@ -156,7 +158,8 @@ def demo_traversal_algorithms():
     print("COMPARISON OF TRAVERSAL ORDERS")
     print("="*80)
     print(f"DFS (Iterative): {' -> '.join(map(str, dfs_order))}")
-    print(f"DFS (Recursive): {' -> '.join(map(str, dfs_recursive_order))}")
+    if COMPARE_RECURSIVE_DFS:
+        print(f"DFS (Recursive): {' -> '.join(map(str, dfs_recursive_order))}")
     print(f"BFS:             {' -> '.join(map(str, bfs_order))}")
     print()
     print("Note: DFS and BFS visit vertices in different orders.")
@@ -170,13 +173,14 @@ def demo_shortest_path_algorithms():
     print("# DEMO 4: SHORTEST PATH ALGORITHMS")
     print("#"*80)
 
-    # Create a weighted graph
+    # Create a weighted graph, representation picked by density
     print("\n>>> Creating a weighted graph (City Network)")
-    graph = GraphAdjacencyList(directed=False, weighted=True)
-
     cities = ['NYC', 'LA', 'Chicago', 'Houston', 'Phoenix', 'Philadelphia']
-    for city in cities:
-        graph.add_vertex(city)
+    routes_count = 8
+    graph = best_representation(len(cities), routes_count,
+                                directed=False, weighted=True)
+
+    graph.add_vertices(cities)
 
     # Add routes with distances
     routes = [
@@ -190,10 +194,8 @@ def demo_shortest_path_algorithms():
         ('Phoenix', 'Philadelphia', 2260)
     ]
 
-    for u, v, distance in routes:
-        graph.add_edge(u, v, distance)
+    graph.add_edges(routes)
 
-    graph.display()
     GraphVisualizer.visualize_graph(graph, "City Network with Distances (miles)")
 
     # Dijkstra's Algorithm
@@ -224,55 +226,45 @@ def demo_advanced_scenarios():
     print("# DEMO 5: ADVANCED SCENARIOS")
     print("#"*80)
 
-    # Scenario 1: Disconnected Graph
+    # Scenario 1: Disconnected Graph (6 vertices, 4 edges -> sparse)
     print("\n>>> SCENARIO 1: Disconnected Graph")
-    graph = GraphAdjacencyList(directed=False, weighted=False)
+    graph = best_representation(6, 4, directed=False, weighted=False)
 
     # Component 1
-    for v in ['A', 'B', 'C']:
-        graph.add_vertex(v)
-    graph.add_edge('A', 'B', 1)
-    graph.add_edge('B', 'C', 1)
+    graph.add_vertices(['A', 'B', 'C'])
+    graph.add_edges([('A', 'B', 1), ('B', 'C', 1)])
 
     # Component 2 (disconnected)
-    for v in ['X', 'Y', 'Z']:
-        graph.add_vertex(v)
-    graph.add_edge('X', 'Y', 1)
-    graph.add_edge('Y', 'Z', 1)
+    graph.add_vertices(['X', 'Y', 'Z'])
+    graph.add_edges([('X', 'Y', 1), ('Y', 'Z', 1)])
 
     graph.display()
     GraphTraversal.is_connected(graph, verbose=True)
 
-    # Scenario 2: Cyclic Graph
+    # Scenario 2: Cyclic Graph (4 vertices, 4 directed edges)
     print("\n>>> SCENARIO 2: Cyclic Graph")
-    cyclic_graph = GraphAdjacencyList(directed=True, weighted=False)
+    cyclic_graph = best_representation(4, 4, directed=True, weighted=False)
 
-    for v in [1, 2, 3, 4]:
-        cyclic_graph.add_vertex(v)
+    cyclic_graph.add_vertices([1, 2, 3, 4])
+    cyclic_graph.add_edges([(1, 2, 1), (2, 3, 1), (3, 4, 1),
+                            (4, 1, 1)])  # Last edge closes the cycle
 
-    cyclic_graph.add_edge(1, 2, 1)
-    cyclic_graph.add_edge(2, 3, 1)
-    cyclic_graph.add_edge(3, 4, 1)
-    cyclic_graph.add_edge(4, 1, 1)  # Cycle
-
-    cyclic_graph.display()
     GraphVisualizer.visualize_graph(cyclic_graph, "Cyclic Directed Graph")
 
     print("\n>>> Detecting cycle through DFS")
     dfs_order = GraphTraversal.depth_first_search(cyclic_graph, 1, verbose=True)
 
-    # Scenario 3: Complete Graph
+    # Scenario 3: Complete Graph (maximum density -> matrix)
     print("\n>>> SCENARIO 3: Complete Graph (K5)")
-    complete_graph = GraphAdjacencyMatrix(directed=False, weighted=False)
+    complete_graph = best_representation(5, 10, directed=False, weighted=False)
 
     vertices = [1, 2, 3, 4, 5]
-    for v in vertices:
-        complete_graph.add_vertex(v)
+    complete_graph.add_vertices(vertices)
 
     # Add all possible edges
-    for i in range(len(vertices)):
-        for j in range(i + 1, len(vertices)):
-            complete_graph.add_edge(vertices[i], vertices[j], 1)
+    complete_graph.add_edges((vertices[i], vertices[j], 1)
+                             for i in range(len(vertices))
+                             for j in range(i + 1, len(vertices)))
 
     complete_graph.display()
     PerformanceAnalysis.analyze_graph_properties(complete_graph, "Complete Graph K5")
@@ -310,16 +302,16 @@ def demo_real_world_application():
 
     print("\n>>> Building a city street network...")
 
-    # Create a detailed city map
-    city_map = GraphAdjacencyList(directed=False, weighted=True)
-
+    # Create a detailed city map, representation picked by density
     locations = [
         'Home', 'School', 'Park', 'Mall', 'Hospital',
         'Library', 'Gym', 'Restaurant', 'Office', 'Station'
     ]
+    roads_count = 15
+    city_map = best_representation(len(locations), roads_count,
+                                   directed=False, weighted=True)
 
-    for loc in locations:
-        city_map.add_vertex(loc)
+    city_map.add_vertices(locations)
 
     # Add roads with travel times (minutes)
     roads = [
@@ -339,10 +331,8 @@ def demo_real_world_application():
         ('Office', 'Station', 12)
     ]
 
-    for u, v, time in roads:
-        city_map.add_edge(u, v, time)
+    city_map.add_edges(roads)
 
-    city_map.display()
     GraphVisualizer.visualize_graph(city_map, "City Street Network (Travel Times in Minutes)")
 
     # Find routes
@@ -369,23 +359,52 @@ def demo_real_world_application():
         print(f"Total travel time: {travel_time} minutes")
         print(f"Number of stops: {len(route) - 1}")
 
-        # Find alternative paths
+        # Further destinations from the same source reuse one memoized
+        # single-source run instead of re-running Dijkstra per query
+        cached_distances, _ = ShortestPath.dijkstra_cached(city_map, start)
+        print(f"\nTravel times from {start} to other destinations:")
+        for place in ('Mall', 'Hospital', 'Office'):
+            print(f"  {start} -> {place}: {cached_distances[place]} minutes")
+
+        # Find alternative paths: the k cheapest routes pop straight
+        # out of the heap with their costs, instead of DFS-enumerating
+        # arbitrary paths and scoring them afterwards
         print("\n>>> Finding alternative routes...")
-        all_routes = GraphTraversal.find_all_paths(city_map, start, destination, max_paths=3, verbose=False)
+        all_routes = ShortestPath.k_shortest_paths(city_map, start, destination, k=3)
 
         if len(all_routes) > 1:
             print("\nAlternative Routes:")
-            for i, alt_route in enumerate(all_routes[1:], 2):
-                # Calculate distance for alternative route
-                alt_distance = 0
-                for j in range(len(alt_route) - 1):
-                    alt_distance += city_map.get_edge_weight(alt_route[j], alt_route[j+1])
+            for i, (alt_route, alt_distance) in enumerate(all_routes[1:], 2):
                 print(f"  Route {i}: {' -> '.join(alt_route)}")
                 print(f"           Travel time: {alt_distance} minutes")
 
         print("="*80)
 
 
+class _ThreadLocalStdout:
+    """
+    stdout proxy that routes worker-thread writes into private buffers.
+
+    Demos submitted to the executor register a StringIO for their
+    thread; writes from any thread without a registered buffer (the
+    main thread) fall through to the real stdout. This keeps the
+    transcript in demo order even though the demos themselves overlap.
+    """
+
+    def __init__(self, real):
+        self._real = real
+        self._local = threading.local()
+
+    def register(self, buffer):
+        self._local.buffer = buffer
+
+    def write(self, text):
+        return getattr(self._local, 'buffer', self._real).write(text)
+
+    def flush(self):
+        getattr(self._local, 'buffer', self._real).flush()
+
+
 def main():
     """Main function to run all demonstrations."""
     print("\n" + "#"*80)
@@ -413,12 +432,45 @@ def main():
         ("Real-World Application", demo_real_world_application)
     ]
 
-    for i, (name, demo_func) in enumerate(demos, 1):
+    # The demos build independent graphs, so all but the benchmark run
+    # concurrently with their output captured per thread; the benchmark
+    # (demo_performance_comparison) times things and runs alone after
+    # the pool has drained so nothing competes with it
+    def run_captured(demo_func):
+        buffer = io.StringIO()
+        proxy.register(buffer)
         try:
             demo_func()
-            print(f"\n[OK] Demo {i} completed successfully\n")
+            return buffer.getvalue(), None
         except Exception as e:
-            print(f"\n[ERROR] Error in Demo {i}: {e}\n")
+            return buffer.getvalue(), e
+
+    proxy = _ThreadLocalStdout(sys.stdout)
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {i: executor.submit(run_captured, demo_func)
+                       for i, (name, demo_func) in enumerate(demos, 1)
+                       if demo_func is not demo_performance_comparison}
+            results = {i: future.result() for i, future in futures.items()}
+
+        # Emit transcripts and banners in submission order
+        for i, (name, demo_func) in enumerate(demos, 1):
+            if i in results:
+                text, error = results[i]
+                sys.stdout.write(text)
+                if error is None:
+                    print(f"\n[OK] Demo {i} completed successfully\n")
+                else:
+                    print(f"\n[ERROR] Error in Demo {i}: {error}\n")
+            else:
+                try:
+                    demo_func()
+                    print(f"\n[OK] Demo {i} completed successfully\n")
+                except Exception as e:
+                    print(f"\n[ERROR] Error in Demo {i}: {e}\n")
+    finally:
+        sys.stdout = proxy._real
 
     # Final summary
     print("\n" + "#"*80)
@@ -3,6 +3,84 @@ Visualization tools for graphs and their traversal/shortest path algorithms.
 Creates ASCII art representations and step-by-step visual outputs.
 """
 
+import io
+import math
+import sys
+import weakref
+from array import array
+
+
+# Display-sorted vertex lists keyed by graph id, validated against a
+# weakref and the mutation version. Every renderer sorts the same
+# vertices by str; for an unmutated graph that is V log V str() calls
+# repeated per visualization, so reuse the list until the graph's
+# _version moves on. The weakref guards against a freed graph's id
+# being recycled by a new graph at the same version
+_SORT_CACHE = {}
+_SORT_CACHE_MAX = 8
+
+
+def _sorted_vertices(graph):
+    """Return the graph's vertices sorted for display, cached per version."""
+    key = id(graph)
+    entry = _SORT_CACHE.get(key)
+    if entry is not None:
+        ref, version, vertices = entry
+        if ref() is graph and version == graph._version:
+            return vertices
+
+    vertices = sorted(graph.get_vertices(), key=str)
+    if len(_SORT_CACHE) >= _SORT_CACHE_MAX:
+        _SORT_CACHE.pop(next(iter(_SORT_CACHE)))
+    _SORT_CACHE[key] = (weakref.ref(graph), graph._version, vertices)
+    return vertices
+
+
+def _snapshot_csr(graph):
+    """
+    Build a CSR-style display snapshot of the graph.
+
+    Vertices are sorted once for stable output; the neighbors of
+    vertices[i] are neighbors[indptr[i]:indptr[i+1]] with parallel
+    weights. Renderers that walk the graph several times iterate these
+    flat rows instead of re-calling get_neighbors per vertex per pass
+    (an O(V) row scan each time on the matrix backend).
+
+    Args:
+        graph: Graph object to snapshot
+
+    Returns:
+        tuple: (vertices, index, indptr, neighbors, weights) where
+               vertices is display-sorted, index inverts it, and the
+               remaining three form the flat adjacency rows
+    """
+    vertices = _sorted_vertices(graph)
+    index = {v: i for i, v in enumerate(vertices)}
+
+    indptr = array('l', [0])
+    neighbors = []
+    weights = []
+    for vertex in vertices:
+        for neighbor, weight in graph.iter_neighbors(vertex):
+            neighbors.append(neighbor)
+            weights.append(weight)
+        indptr.append(len(neighbors))
+
+    return vertices, index, indptr, neighbors, weights
+
+
+# Step-status cell templates for visualize_traversal; tiny constant
+# %-templates skip the format-spec parsing an f-string pays per cell
+_CUR = "[%s*]"
+_VIS = "[%s+]"
+_UNV = "[%s ]"
+
+# Per-hop breakdown block for visualize_shortest_path: one cached
+# %-template append per hop instead of four separate f-strings
+_HOP_FMT = ("Step %d: %s -> %s\n"
+            "        Edge weight: %s\n"
+            "        Cumulative: %s\n\n")
+
 
 class GraphVisualizer:
     """
@@ -10,58 +88,84 @@ class GraphVisualizer:
     """
 
     @staticmethod
-    def visualize_graph(graph, title="Graph Visualization"):
+    def visualize_graph(graph, title="Graph Visualization", include_display=True):
         """
         Create an ASCII visualization of the graph structure.
 
+        Subsumes the representation banner the demos used to get from a
+        separate graph.display() call right before visualizing, so one
+        call site covers both views.
+
         Args:
             graph: Graph object to visualize
             title: Title for the visualization
+            include_display: Whether to print the representation's own
+                             display() block first
         """
-        print("\n" + "="*70)
-        print(title.center(70))
-        print("="*70)
+        if include_display:
+            graph.display()
+
+        # Collect all lines and flush with one stdout write instead of
+        # one locked print call per line
+        out = []
+        out.append("\n" + "="*70 + "\n")
+        out.append(title.center(70) + "\n")
+        out.append("="*70 + "\n")
 
-        vertices = sorted(graph.get_vertices(), key=str)
+        vertices, index, indptr, neighbors, weights = _snapshot_csr(graph)
 
         if not vertices:
-            print("Empty graph")
-            print("="*70 + "\n")
+            out.append("Empty graph\n")
+            out.append("="*70 + "\n\n")
+            sys.stdout.write("".join(out))
             return
 
-        print(f"\nVertices: {', '.join(map(str, vertices))}")
-        print(f"Total: {len(vertices)} vertices, {graph.get_edge_count()} edges")
-        print("\nEdge List:")
-        print("-"*70)
+        out.append(f"\nVertices: {', '.join(map(str, vertices))}\n")
+        out.append(f"Total: {len(vertices)} vertices, {graph.get_edge_count()} edges\n")
 
+        # One fused sweep over the snapshot rows fills both sections'
+        # buffers; the edge list and adjacency view used to each make
+        # their own pass over the same data
+        directed = graph.directed
+        weighted = graph.weighted
+        arrow = "->" if directed else "<->"
         edges = []
-        for vertex in vertices:
-            neighbors = graph.get_neighbors(vertex)
-            for neighbor, weight in neighbors:
-                if graph.directed or str(vertex) <= str(neighbor):  # Avoid duplicates for undirected
-                    arrow = "->" if graph.directed else "<->"
-                    weight_str = f"[{weight}]" if graph.weighted else ""
+        adj_out = []
+        for i, vertex in enumerate(vertices):
+            lo, hi = indptr[i], indptr[i + 1]
+            if lo == hi:
+                adj_out.append(f"  {vertex:>5} -> {{ isolated }}\n")
+                continue
+
+            neighbor_list = []
+            for p in range(lo, hi):
+                neighbor = neighbors[p]
+                if weighted:
+                    neighbor_list.append(f"{neighbor}({weights[p]})")
+                else:
+                    neighbor_list.append(str(neighbor))
+                # Avoid duplicates for undirected: vertices are sorted
+                # by str, so comparing snapshot indices matches the old
+                # str(u) <= str(v) test without allocating the strings
+                if directed or i <= index[neighbor]:
+                    weight_str = f"[{weights[p]}]" if weighted else ""
                     edges.append(f"{vertex} {arrow} {neighbor} {weight_str}")
+            adj_out.append(f"  {vertex:>5} -> {{ {', '.join(neighbor_list)} }}\n")
 
+        out.append("\nEdge List:\n")
+        out.append("-"*70 + "\n")
         if edges:
             for edge in edges:
-                print(f"  {edge}")
+                out.append(f"  {edge}\n")
         else:
-            print("  No edges")
+            out.append("  No edges\n")
 
-        # Create adjacency representation
-        print("\nAdjacency Relationships:")
-        print("-"*70)
-        for vertex in vertices:
-            neighbors = graph.get_neighbors(vertex)
-            if neighbors:
-                neighbor_list = [f"{n}({w})" if graph.weighted else str(n)
-                               for n, w in neighbors]
-                print(f"  {vertex:>5} -> {{ {', '.join(neighbor_list)} }}")
-            else:
-                print(f"  {vertex:>5} -> {{ isolated }}")
+        out.append("\nAdjacency Relationships:\n")
+        out.append("-"*70 + "\n")
+        out.extend(adj_out)
 
-        print("="*70 + "\n")
+        out.append("="*70 + "\n\n")
+        sys.stdout.write("".join(out))
 
     @staticmethod
     def visualize_traversal(graph, traversal_order, algorithm_name, start_vertex):
@@ -74,43 +178,56 @@ class GraphVisualizer:
             algorithm_name: Name of the algorithm (DFS/BFS)
             start_vertex: Starting vertex
         """
-        print("\n" + "="*70)
-        print(f"{algorithm_name} TRAVERSAL VISUALIZATION".center(70))
-        print("="*70)
-        print(f"Start: {start_vertex}")
-        print(f"Order: {' -> '.join(map(str, traversal_order))}")
-        print("-"*70)
+        # Buffered like visualize_graph: build lines, write once
+        out = []
+        out.append("\n" + "="*70 + "\n")
+        out.append(f"{algorithm_name} TRAVERSAL VISUALIZATION".center(70) + "\n")
+        out.append("="*70 + "\n")
+        out.append(f"Start: {start_vertex}\n")
+        out.append(f"Order: {' -> '.join(map(str, traversal_order))}\n")
+        out.append("-"*70 + "\n")
 
         # Show step-by-step
-        print("\nStep-by-Step Visualization:")
-        print()
-
-        visited = set()
+        out.append("\nStep-by-Step Visualization:\n")
+        out.append("\n")
+
+        vertices, index, indptr, neighbors, _ = _snapshot_csr(graph)
+        # Stringify every vertex once; the step loop would otherwise
+        # redo str(v) for all V vertices on each of T steps
+        vstr = [str(v) for v in vertices]
+
+        # Visited membership as an int bitmask over snapshot indices:
+        # one bit per vertex, tested with a shift-and-mask instead of
+        # hashing arbitrary vertex labels every step
+        visited_mask = 0
         for step, vertex in enumerate(traversal_order, 1):
-            visited.add(vertex)
+            current = index[vertex]
+            visited_mask |= 1 << current
 
             # Create visual representation
             status = []
-            for v in sorted(graph.get_vertices(), key=str):
-                if v == vertex:
-                    status.append(f"[{v}*]")  # Current
-                elif v in visited:
-                    status.append(f"[{v}+]")  # Visited
+            for j, s in enumerate(vstr):
+                if j == current:
+                    status.append(_CUR % s)  # Current
+                elif visited_mask & (1 << j):
+                    status.append(_VIS % s)  # Visited
                 else:
-                    status.append(f"[{v} ]")  # Unvisited
+                    status.append(_UNV % s)  # Unvisited
 
-            print(f"Step {step:2d}: {' '.join(status)}")
-            print(f"         Visiting: {vertex}")
+            out.append(f"Step {step:2d}: {' '.join(status)}\n")
+            out.append(f"         Visiting: {vertex}\n")
 
-            # Show neighbors
-            neighbors = graph.get_neighbors(vertex)
-            if neighbors:
-                neighbor_names = [str(n) for n, w in neighbors]
-                print(f"         Neighbors: {', '.join(neighbor_names)}")
-            print()
+            # Show neighbors from the snapshot row
+            i = index[vertex]
+            if indptr[i] < indptr[i + 1]:
+                neighbor_names = [str(neighbors[p])
+                                  for p in range(indptr[i], indptr[i + 1])]
+                out.append(f"         Neighbors: {', '.join(neighbor_names)}\n")
+            out.append("\n")
 
-        print("Legend: [*] = Current, [+] = Visited, [ ] = Unvisited")
-        print("="*70 + "\n")
+        out.append("Legend: [*] = Current, [+] = Visited, [ ] = Unvisited\n")
+        out.append("="*70 + "\n\n")
+        sys.stdout.write("".join(out))
 
     @staticmethod
     def visualize_shortest_path(graph, start_vertex, end_vertex, path, distance):
@@ -124,52 +241,68 @@ class GraphVisualizer:
             path: List of vertices in the shortest path
             distance: Total distance of the path
         """
-        print("\n" + "="*70)
-        print("SHORTEST PATH VISUALIZATION".center(70))
-        print("="*70)
-        print(f"From: {start_vertex}")
-        print(f"To: {end_vertex}")
+        # Buffered like visualize_graph: build lines, write once
+        out = []
+        out.append("\n" + "="*70 + "\n")
+        out.append("SHORTEST PATH VISUALIZATION".center(70) + "\n")
+        out.append("="*70 + "\n")
+        out.append(f"From: {start_vertex}\n")
+        out.append(f"To: {end_vertex}\n")
 
         if not path:
-            print("\nNo path exists!")
-            print("="*70 + "\n")
+            out.append("\nNo path exists!\n")
+            out.append("="*70 + "\n\n")
+            sys.stdout.write("".join(out))
             return
 
-        print(f"Distance: {distance}")
-        print(f"Hops: {len(path) - 1}")
-        print("-"*70)
+        out.append(f"Distance: {distance}\n")
+        out.append(f"Hops: {len(path) - 1}\n")
+        out.append("-"*70 + "\n")
 
         # Visual path representation
-        print("\nPath:")
-        print()
+        out.append("\nPath:\n")
+        out.append("\n")
         path_str = " -> ".join(map(str, path))
-        print(f"  {path_str}")
-        print()
+        out.append(f"  {path_str}\n")
+        out.append("\n")
+
+        # One snapshot serves the hop breakdown and the highlight
+        # section below; per-hop weights come out of a dict built from
+        # its rows instead of a get_edge_weight neighbor scan per hop
+        vertices, index, indptr, neighbors, weights = _snapshot_csr(graph)
+        edge_w = {}
+        for i, vertex in enumerate(vertices):
+            for p in range(indptr[i], indptr[i + 1]):
+                edge_w[(vertex, neighbors[p])] = weights[p]
 
         # Detailed breakdown
-        print("Detailed Breakdown:")
-        print("-"*70)
+        out.append("Detailed Breakdown:\n")
+        out.append("-"*70 + "\n")
 
         cumulative_distance = 0
         for i in range(len(path) - 1):
             u, v = path[i], path[i + 1]
-            weight = graph.get_edge_weight(u, v)
+            weight = edge_w[(u, v)]
             cumulative_distance += weight
-
-            print(f"Step {i+1}: {u} -> {v}")
-            print(f"        Edge weight: {weight}")
-            print(f"        Cumulative: {cumulative_distance}")
-            print()
+            out.append(_HOP_FMT % (i + 1, u, v, weight, cumulative_distance))
 
         # Highlight on graph
-        print("Path Highlighted on Graph:")
-        print("-"*70)
+        out.append("Path Highlighted on Graph:\n")
+        out.append("-"*70 + "\n")
 
+        # Pack each path edge into one int (u index in the high bits,
+        # v in the low); membership in the nested loop below then hashes
+        # a single int instead of a 2-tuple per scanned edge. For
+        # undirected graphs both orientations of a hop are on the path
         path_set = set(path)
-        path_edges = set((path[i], path[i+1]) for i in range(len(path) - 1))
+        path_bits = set()
+        for u, v in zip(path, path[1:]):
+            path_bits.add((index[u] << 32) | index[v])
+            if not graph.directed:
+                path_bits.add((index[v] << 32) | index[u])
+        path_bits = frozenset(path_bits)
 
-        vertices = sorted(graph.get_vertices(), key=str)
-        for vertex in vertices:
+        for i, vertex in enumerate(vertices):
             if vertex in path_set:
                 if vertex == start_vertex:
                     marker = "START"
@@ -177,24 +310,26 @@ class GraphVisualizer:
                     marker = "END"
                 else:
                     marker = "PATH"
-                print(f"  [{vertex}] {marker:>10}", end="")
+                out.append(f"  [{vertex}] {marker:>10}")
             else:
-                print(f"  [{vertex}] {'':>10}", end="")
+                out.append(f"  [{vertex}] {'':>10}")
 
-            neighbors = graph.get_neighbors(vertex)
-            if neighbors:
+            if indptr[i] < indptr[i + 1]:
                 neighbor_strs = []
-                for neighbor, weight in neighbors:
-                    if (vertex, neighbor) in path_edges:
-                        neighbor_strs.append(f"-> {neighbor}({weight}) *")
+                base = i << 32
+                for p in range(indptr[i], indptr[i + 1]):
+                    neighbor = neighbors[p]
+                    if (base | index[neighbor]) in path_bits:
+                        neighbor_strs.append(f"-> {neighbor}({weights[p]}) *")
                     else:
-                        neighbor_strs.append(f"-> {neighbor}({weight})")
-                print(f"  {', '.join(neighbor_strs)}")
+                        neighbor_strs.append(f"-> {neighbor}({weights[p]})")
+                out.append(f"  {', '.join(neighbor_strs)}\n")
             else:
-                print()
+                out.append("\n")
 
-        print("\n* = Edge on shortest path")
-        print("="*70 + "\n")
+        out.append("\n* = Edge on shortest path\n")
+        out.append("="*70 + "\n\n")
+        sys.stdout.write("".join(out))
 
     @staticmethod
     def visualize_graph_ascii_art(graph, highlight_vertices=None):
@@ -213,10 +348,48 @@ class GraphVisualizer:
         print("ASCII ART REPRESENTATION".center(70))
         print("="*70)
 
-        vertices = sorted(graph.get_vertices(), key=str)
+        vertices = _sorted_vertices(graph)
 
         if len(vertices) > 10:
-            print("Graph too large for ASCII art (max 10 vertices)")
+            # Too many vertices for the indented listing below; lay
+            # them out on a circle and raster edges into a character
+            # grid instead of bailing out
+            n = len(vertices)
+            width, height = 68, 25
+            cx, cy = (width - 1) / 2, (height - 1) / 2
+            rx, ry = cx - 2, cy - 1
+            grid = [bytearray(b' ' * width) for _ in range(height)]
+
+            two_pi = 2 * math.pi
+            coords = [(cx + rx * math.cos(two_pi * i / n),
+                       cy + ry * math.sin(two_pi * i / n))
+                      for i in range(n)]
+
+            # Edges as interpolated dots under the vertex markers
+            index = {v: i for i, v in enumerate(vertices)}
+            for i, vertex in enumerate(vertices):
+                x0, y0 = coords[i]
+                for neighbor, _ in graph.iter_neighbors(vertex):
+                    j = index[neighbor]
+                    if not graph.directed and j < i:
+                        continue
+                    x1, y1 = coords[j]
+                    steps = int(max(abs(x1 - x0), abs(y1 - y0))) or 1
+                    for s in range(1, steps):
+                        t = s / steps
+                        gy = round(y0 + (y1 - y0) * t)
+                        gx = round(x0 + (x1 - x0) * t)
+                        if grid[gy][gx] == 32:
+                            grid[gy][gx] = 46  # '.'
+
+            for i, vertex in enumerate(vertices):
+                x, y = coords[i]
+                grid[round(y)][round(x)] = 42 if vertex in highlight_vertices else 111
+
+            print()
+            sys.stdout.write("\n".join(row.decode('ascii') for row in grid) + "\n")
+            print(f"\n{n} vertices on the ring "
+                  f"(o = vertex, * = highlighted, . = edge)")
             print("="*70 + "\n")
             return
 
@@ -261,12 +434,18 @@ class GraphVisualizer:
         print(f"{'Vertex':<15} {'Distance':<15} {'Status':<15}")
         print("-"*60)
 
-        vertices = sorted([v for v in graph.get_vertices()], key=str)
+        vertices = _sorted_vertices(graph)
 
+        # Format all rows in one pass with the lookups hoisted, then
+        # print once per row; no repeated float('inf') construction or
+        # attribute lookups inside the loop
+        inf = float('inf')
+        get_distance = distances.get
+        rows = []
         for vertex in vertices:
-            distance = distances.get(vertex, float('inf'))
+            distance = get_distance(vertex, inf)
 
-            if distance == float('inf'):
+            if distance == inf:
                 dist_str = "∞"
                 status = "Unreachable"
             elif distance == 0:
@@ -276,7 +455,10 @@ class GraphVisualizer:
                 dist_str = str(distance)
                 status = "Reachable"
 
-            print(f"{str(vertex):<15} {dist_str:<15} {status:<15}")
+            rows.append(f"{str(vertex):<15} {dist_str:<15} {status:<15}")
+
+        for row in rows:
+            print(row)
 
         print("="*60 + "\n")
 
@@ -289,12 +471,17 @@ class GraphVisualizer:
             steps: List of (step_number, description) tuples
             title: Title for the timeline
         """
-        print("\n" + "="*70)
-        print(title.center(70))
-        print("="*70)
-
+        # One buffered write for the whole timeline; long traces would
+        # otherwise pay a print call per step
+        buf = io.StringIO()
+        buf.write("\n" + "="*70 + "\n")
+        buf.write(title.center(70) + "\n")
+        buf.write("="*70 + "\n")
+
+        write = buf.write
         for step_num, description in steps:
-            print(f"\n{'>' if step_num > 0 else 'o'} Step {step_num}: {description}")
+            write(f"\n{'>' if step_num > 0 else 'o'} Step {step_num}: {description}\n")
 
-        print("\n" + "="*70 + "\n")
+        buf.write("\n" + "="*70 + "\n\n")
+        sys.stdout.write(buf.getvalue())
 